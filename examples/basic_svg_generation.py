@@ -4,22 +4,22 @@
 Basic example of generating SVGs using the svg-generator library.
 
 This example demonstrates how to use the main components of the SVG generator
-to create a simple visual based on a text prompt.
+to create a simple visual based on a text prompt. It expects the package
+to be installed (e.g. `pip install -e .`).
 """
-import os
-import sys
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
-# Add the project root to Python path for easier imports
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+from svg_generator.config import DEFAULT_STYLE_PROFILE_NAME
+from svg_generator.parsing.semantic_parser import get_parser
+from svg_generator.scene.scene_orchestrator import get_orchestrator
+from svg_generator.style.style_profiles import StyleProfile
+from svg_generator.svg.generator import SVGGenerator
+from svg_generator.utils.sanitize import Sanitizer
+from svg_generator.utils.optimizer import Optimizer
 
-from src.svg_generator.parsing.semantic_parser import SemanticParser
-from src.svg_generator.scene.scene_orchestrator import SceneOrchestrator
-from src.svg_generator.svg.generator import SVGGenerator
-from src.svg_generator.utils.sanitize import Sanitizer
-from src.svg_generator.utils.optimizer import Optimizer
+project_root = Path(__file__).parent.parent
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, 
@@ -28,22 +28,24 @@ logger = logging.getLogger(__name__)
 
 def generate_svg_from_prompt(prompt, output_path=None):
     """Generate an SVG from a text prompt and optionally save it to a file."""
-    logger.info(f"Generating SVG from prompt: '{prompt}'")
+    logger.info("Generating SVG from prompt: '%s'", prompt)
+    
+    style = StyleProfile.load(DEFAULT_STYLE_PROFILE_NAME)
     
     # Parse the text prompt
-    parser = SemanticParser()
+    parser = get_parser()
     parsed_elements = parser.parse(prompt)
-    logger.info(f"Parsed {len(parsed_elements)} elements from prompt")
+    logger.info("Parsed %d elements from prompt", len(parsed_elements))
     
     # Build the scene
-    orchestrator = SceneOrchestrator()
+    orchestrator = get_orchestrator(style)
     scene = orchestrator.build_scene(parsed_elements)
     logger.info("Scene built successfully")
     
     # Generate SVG
-    generator = SVGGenerator()
+    generator = SVGGenerator(style)
     svg_string = generator.generate(scene)
-    logger.info(f"Generated SVG with length: {len(svg_string)}")
+    logger.info("Generated SVG with length: %d", len(svg_string))
     
     # Sanitize and optimize
     sanitizer = Sanitizer()
@@ -52,36 +54,39 @@ def generate_svg_from_prompt(prompt, output_path=None):
     sanitized_svg = sanitizer.sanitize_svg_string(svg_string)
     optimized_svg = optimizer.optimize_svg_string(sanitized_svg)
     
-    logger.info(f"Original size: {len(svg_string)}, Optimized size: {len(optimized_svg)}")
+    logger.info("Original size: %d, Optimized size: %d", len(svg_string), len(optimized_svg))
     
     # Save to file if output path provided
     if output_path:
         with open(output_path, 'w') as f:
             f.write(optimized_svg)
-        logger.info(f"SVG saved to: {output_path}")
+        logger.info("SVG saved to: %s", output_path)
     
     return optimized_svg
 
+def _worker(job):
+    """Process-pool entry point: unpacks a (prompt, output_path) job."""
+    prompt, output_path = job
+    return generate_svg_from_prompt(prompt, output_path)
+
 def main():
     """Run the example."""
     # Create output directory if it doesn't exist
     output_dir = project_root / "examples" / "output"
     output_dir.mkdir(exist_ok=True)
     
-    # Example 1: Simple geometric scene
-    prompt1 = "A blue circle above a red square"
-    output_path1 = output_dir / "geometric_scene.svg"
-    generate_svg_from_prompt(prompt1, output_path1)
-    
-    # Example 2: More complex description
-    prompt2 = "A green mountain landscape with a yellow sun in the sky"
-    output_path2 = output_dir / "landscape.svg"
-    generate_svg_from_prompt(prompt2, output_path2)
+    jobs = [
+        # Example 1: Simple geometric scene
+        ("A blue circle above a red square", output_dir / "geometric_scene.svg"),
+        # Example 2: More complex description
+        ("A green mountain landscape with a yellow sun in the sky", output_dir / "landscape.svg"),
+        # Example 3: Abstract pattern
+        ("A pattern of alternating purple and orange hexagons", output_dir / "pattern.svg"),
+    ]
     
-    # Example 3: Abstract pattern
-    prompt3 = "A pattern of alternating purple and orange hexagons"
-    output_path3 = output_dir / "pattern.svg"
-    generate_svg_from_prompt(prompt3, output_path3)
+    # The prompts are independent, so generate them in parallel worker processes
+    with ProcessPoolExecutor(max_workers=len(jobs)) as executor:
+        list(executor.map(_worker, jobs))
     
     logger.info("All examples completed successfully")
 
@@ -1,15 +1,19 @@
 # src/svg_generator/config.py
 """Global constants and configuration settings."""
 
-from typing import Set
+import sys
+from typing import Final, FrozenSet
 
 # Kaggle-like competition constraints
 MAX_SVG_SIZE_BYTES: int = 10 * 1024  # 10KB
-ALLOWED_SVG_TAGS: Set[str] = {
+# Immutable and interned: these are probed once per tag/attribute during sanitization
+ALLOWED_SVG_TAGS: Final[FrozenSet[str]] = frozenset(map(sys.intern, (
     "svg", "path", "circle", "rect", "polygon", "g", "defs",
     "linearGradient", "radialGradient", "stop", "pattern"
-}
-PROHIBITED_SVG_ATTRIBUTES: Set[str] = {"style", "filter", "href", "class", "id"} # Allow 'id' for defs
+)))
+PROHIBITED_SVG_ATTRIBUTES: Final[FrozenSet[str]] = frozenset(map(sys.intern, (
+    "style", "filter", "href", "class", "id" # Allow 'id' for defs
+)))
 # Note: 'id' is needed for defs, so sanitize.py needs to be smart about it.
 # `xlink:href` is also often prohibited, `href` is the SVG 2 replacement.
 
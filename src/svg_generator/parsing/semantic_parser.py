@@ -1,9 +1,31 @@
 # src/svg_generator/parsing/semantic_parser.py
-from typing import List, Dict, Any
+import functools
+import re
+from typing import List, Dict, Any, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Vocabulary understood by the placeholder parser.
+_KEYWORDS = frozenset({"circle", "square", "sun", "blue", "red", "green", "yellow"})
+
+# Single case-insensitive pass over the prompt that yields only known keywords.
+_KEYWORD_RE = re.compile(r"\b(" + "|".join(sorted(_KEYWORDS)) + r")\b", re.IGNORECASE)
+
+# Object keywords in the order their elements are emitted.
+_OBJECT_NAMES: Tuple[str, ...] = ("circle", "square", "sun")
+
+# Colour keywords each object may pick up from the prompt, in order of preference.
+_OBJECT_COLORS: Dict[str, Tuple[str, ...]] = {
+    "circle": ("blue", "red"),
+    "square": ("red", "green"),
+}
+
+# Attributes applied to an object regardless of the rest of the prompt.
+_OBJECT_DEFAULTS: Dict[str, Dict[str, Any]] = {
+    "sun": {"color": "yellow"},
+}
+
 class SemanticParser:
     """
     Parses a text prompt into a structured representation of semantic elements.
@@ -26,41 +48,38 @@ class SemanticParser:
             Example: [{'type': 'object', 'name': 'circle', 'color': 'blue', 'position': 'next to object_2'},
                       {'type': 'object', 'name': 'square', 'id': 'object_2', 'color': 'red'}]
         """
-        logger.info(f"Parsing prompt: '{prompt}'")
+        logger.info("Parsing prompt: '%s'", prompt)
         # --- Placeholder Logic ---
         # This needs to be replaced with actual NLP parsing logic.
         # For now, let's do a very naive split and keyword identification.
         elements = []
-        words = prompt.lower().split()
-        
+        found = {match.group(1).lower() for match in _KEYWORD_RE.finditer(prompt)}
+
         # Simple keyword matching
-        if "circle" in words:
-            circle_element = {"type": "object", "name": "circle", "attributes": {}}
-            if "blue" in words:
-                circle_element["attributes"]["color"] = "blue"
-            elif "red" in words:
-                circle_element["attributes"]["color"] = "red"
-            elements.append(circle_element)
-        
-        if "square" in words:
-            square_element = {"type": "object", "name": "square", "attributes": {}}
-            if "red" in words and "square" in words: # Naive disambiguation
-                 square_element["attributes"]["color"] = "red"
-            elif "green" in words:
-                square_element["attributes"]["color"] = "green"
-            elements.append(square_element)
-
-        if "sun" in words:
-            elements.append({"type": "object", "name": "sun", "attributes": {"color": "yellow"}})
+        for name in _OBJECT_NAMES:
+            if name not in found:
+                continue
+            attributes = dict(_OBJECT_DEFAULTS.get(name, {}))
+            for color in _OBJECT_COLORS.get(name, ()):
+                if color in found:
+                    attributes["color"] = color
+                    break
+            elements.append({"type": "object", "name": name, "attributes": attributes})
 
         if not elements and prompt: # Fallback for unknown prompts
              elements.append({"type": "unknown", "description": prompt, "attributes": {}})
 
 
         if not elements:
-            logger.warning(f"No recognizable elements found in prompt: '{prompt}'")
+            logger.warning("No recognizable elements found in prompt: '%s'", prompt)
             # Could return a default "empty scene" representation or raise an error
             return [{"type": "scene_info", "status": "empty", "prompt": prompt}]
             
-        logger.debug(f"Parsed into: {elements}")
+        logger.debug("Parsed into: %s", elements)
         return elements
+
+
+@functools.cache
+def get_parser() -> SemanticParser:
+    """Returns the process-wide SemanticParser, creating it on first use."""
+    return SemanticParser()
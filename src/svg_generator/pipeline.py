@@ -0,0 +1,57 @@
+# src/svg_generator/pipeline.py
+"""
+Post-generation pipeline: sanitization and optimization of a generated SVG.
+
+The document is parsed once with lxml, sanitized in place and serialized once
+before optimization, rather than each stage parsing and serializing it on its own.
+"""
+import functools
+import logging
+
+from lxml import etree
+
+from svg_generator.utils.optimizer import Optimizer
+from svg_generator.utils.sanitize import ROOT_REMOVED_FALLBACK_SVG, Sanitizer
+
+logger = logging.getLogger(__name__)
+
+# Comments and processing instructions are dropped while parsing; entities are
+# never expanded.
+_PARSER = etree.XMLParser(remove_comments=True, remove_pis=True, resolve_entities=False, no_network=True)
+
+
+@functools.cache
+def _get_sanitizer() -> Sanitizer:
+    return Sanitizer()
+
+
+@functools.cache
+def _get_optimizer() -> Optimizer:
+    return Optimizer()
+
+
+def process(raw: bytes) -> bytes:
+    """
+    Sanitizes and optimizes a generated SVG document.
+
+    Args:
+        raw: The SVG document as UTF-8 bytes.
+
+    Returns:
+        The sanitized and optimized SVG as UTF-8 bytes.
+    """
+    try:
+        root = etree.fromstring(raw, _PARSER)
+    except etree.XMLSyntaxError as e:
+        logger.error("XML syntax error during sanitization: %s. Optimizing the unsanitized SVG.", e)
+        sanitized_svg = raw.decode("utf-8")
+    else:
+        root = _get_sanitizer().sanitize_tree(root)
+        if root is None:
+            logger.error("Root SVG element was disallowed during sanitization. Returning empty SVG.")
+            sanitized_svg = ROOT_REMOVED_FALLBACK_SVG
+        else:
+            sanitized_svg = etree.tostring(root, encoding="unicode")
+            logger.info("SVG content sanitized.")
+
+    return _get_optimizer().optimize_svg_bytes(sanitized_svg)
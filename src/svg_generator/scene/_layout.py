@@ -0,0 +1,62 @@
+# src/svg_generator/scene/_layout.py
+"""
+Layout arithmetic used by SceneOrchestrator.build_scene.
+"""
+# Element kind codes understood by compute_positions
+KIND_SKIP = -1     # Not drawn, does not advance the layout
+KIND_CIRCLE = 0
+KIND_SQUARE = 1
+KIND_SUN = 2
+KIND_UNKNOWN = 3   # Placeholder rectangle for unrecognised prompt text
+
+
+def compute_positions(kinds, simple, width):
+    """
+    Lays elements out left to right starting at (50, 50).
+
+    Args:
+        kinds: List of KIND_* codes, one per parsed element
+        simple: True if the style's shape complexity is "simple"
+        width: Width of the scene canvas
+
+    Returns:
+        Tuple of int lists (xs, ys, widths, heights). For circles (x, y) is
+        the centre and width/height hold the radius; for rectangles (x, y) is
+        the top-left corner. Entries for KIND_SKIP are left at zero.
+    """
+    n = len(kinds)
+    xs = [0] * n
+    ys = [0] * n
+    widths = [0] * n
+    heights = [0] * n
+
+    current_x = 50
+    current_y = 50
+    for i in range(len(kinds)):
+        kind = kinds[i]
+        if kind == KIND_CIRCLE:
+            radius = 25 if simple else 40
+            xs[i] = current_x + 25
+            ys[i] = current_y + 25
+            widths[i] = radius
+            heights[i] = radius
+            current_x += 60
+        elif kind == KIND_SQUARE:
+            side = 50 if simple else 80
+            xs[i] = current_x
+            ys[i] = current_y
+            widths[i] = side
+            heights[i] = side
+            current_x += 60 if simple else 90
+        elif kind == KIND_SUN:
+            xs[i] = width - 70
+            ys[i] = 70
+            widths[i] = 50
+            heights[i] = 50
+        elif kind == KIND_UNKNOWN:
+            xs[i] = current_x
+            ys[i] = current_y
+            widths[i] = 100
+            heights[i] = 20
+            current_x += 110
+    return xs, ys, widths, heights
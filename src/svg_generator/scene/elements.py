@@ -0,0 +1,90 @@
+# src/svg_generator/scene/elements.py
+"""
+Typed scene elements produced by the SceneOrchestrator.
+
+Each element is a slotted dataclass, so a scene with many shapes stores a
+fixed set of attribute slots per element instead of one hash table each.
+"""
+import sys
+from dataclasses import dataclass, fields
+from typing import Any, ClassVar, Dict, NamedTuple, Optional, Tuple, Union
+
+
+@dataclass(slots=True, kw_only=True)
+class SceneElement:
+    """Presentation attributes shared by every scene element."""
+    type: ClassVar[str] = ""
+
+    id: str
+    fill: Optional[str] = None
+    stroke: Optional[str] = None
+    stroke_width: Optional[float] = None
+    stroke_dasharray: Optional[str] = None
+    opacity: Optional[float] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the element as an SVG-keyed dictionary, omitting unset attributes."""
+        element_dict: Dict[str, Any] = {"type": self.type}
+        for field in fields(self):
+            value = getattr(self, field.name)
+            if value is not None:
+                element_dict[field.name.replace("_", "-")] = value
+        return element_dict
+
+
+@dataclass(slots=True, kw_only=True)
+class CircleElement(SceneElement):
+    """A <circle> element."""
+    type: ClassVar[str] = sys.intern("circle")
+
+    cx: float
+    cy: float
+    r: float
+
+
+@dataclass(slots=True, kw_only=True)
+class RectElement(SceneElement):
+    """A <rect> element."""
+    type: ClassVar[str] = sys.intern("rect")
+
+    x: float
+    y: float
+    width: float
+    height: float
+
+
+@dataclass(slots=True, kw_only=True)
+class LineElement(SceneElement):
+    """A <line> element."""
+    type: ClassVar[str] = sys.intern("line")
+
+    x1: float
+    y1: float
+    x2: float
+    y2: float
+
+
+class Scene(NamedTuple):
+    """
+    A complete scene as consumed by SVGGenerator.
+
+    elements holds SceneElement instances or plain element dictionaries (as
+    produced by ShapeFactory and the renderers); definitions holds gradient
+    and pattern dictionaries for the <defs> section.
+    """
+    width: int
+    height: int
+    background_color: Optional[str]
+    elements: Tuple[Union[SceneElement, Dict[str, Any]], ...]
+    definitions: Tuple[Dict[str, Any], ...] = ()
+
+    @classmethod
+    def from_dict(cls, scene_desc: Dict[str, Any]) -> "Scene":
+        """Builds a Scene from a dictionary scene description."""
+        return cls(
+            width=scene_desc.get("width", 800),
+            height=scene_desc.get("height", 600),
+            background_color=scene_desc.get("background_color"),
+            elements=tuple(scene_desc.get("elements", ())),
+            definitions=tuple(scene_desc.get("definitions", ())),
+        )
@@ -1,10 +1,62 @@
 # src/svg_generator/scene/scene_orchestrator.py
-from typing import List, Dict, Any
+import functools
+import sys
+from typing import Any, Callable, Dict, List, NamedTuple
+from svg_generator.scene._layout import (
+    KIND_CIRCLE, KIND_SKIP, KIND_SQUARE, KIND_SUN, KIND_UNKNOWN, compute_positions
+)
+from svg_generator.scene.elements import CircleElement, RectElement, Scene, SceneElement
 from svg_generator.style.style_profiles import StyleProfile
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Layout kind for each supported object name
+_OBJECT_KINDS: Dict[str, int] = {"circle": KIND_CIRCLE, "square": KIND_SQUARE, "sun": KIND_SUN}
+
+
+def _element_kind(element_data: Dict[str, Any]) -> int:
+    """Returns the layout kind code for a parsed element."""
+    element_type = element_data.get("type")
+    if element_type == "object":
+        return _OBJECT_KINDS.get(element_data.get("name", "unknown"), KIND_SKIP)
+    if element_type == "unknown":
+        return KIND_UNKNOWN
+    return KIND_SKIP
+
+
+class _ShapeContext(NamedTuple):
+    """Layout slot and shared presentation attributes for one scene element."""
+    x: int
+    y: int
+    width: int
+    height: int
+    common: Dict[str, Any]
+
+
+def _build_circle(style: StyleProfile, ctx: _ShapeContext, attributes: Dict[str, Any]) -> SceneElement:
+    return CircleElement(cx=ctx.x, cy=ctx.y, r=ctx.width, **ctx.common)
+
+
+def _build_rect(style: StyleProfile, ctx: _ShapeContext, attributes: Dict[str, Any]) -> SceneElement:
+    # Assuming 'square' implies 'rect' for SVG
+    return RectElement(x=ctx.x, y=ctx.y, width=ctx.width, height=ctx.height, **ctx.common)
+
+
+def _build_sun(style: StyleProfile, ctx: _ShapeContext, attributes: Dict[str, Any]) -> SceneElement:
+    # Special object: sun is usually yellow
+    common = {**ctx.common, "fill": sys.intern(attributes.get("color", "yellow"))}
+    return CircleElement(cx=ctx.x, cy=ctx.y, r=ctx.width, **common)
+
+
+# Scene element builder for each supported object name
+_SHAPE_BUILDERS: Dict[str, Callable[[StyleProfile, _ShapeContext, Dict[str, Any]], SceneElement]] = {
+    "circle": _build_circle,
+    "square": _build_rect,
+    "sun": _build_sun,
+}
+
+
 class SceneOrchestrator:
     """
     Takes parsed semantic elements and a style profile to create
@@ -13,9 +65,9 @@ class SceneOrchestrator:
     """
     def __init__(self, style: StyleProfile):
         self.style = style
-        logger.debug(f"SceneOrchestrator initialized with style: {style.name}")
+        logger.debug("SceneOrchestrator initialized with style: %s", style.name)
 
-    def build_scene(self, parsed_elements: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def build_scene(self, parsed_elements: List[Dict[str, Any]]) -> Scene:
         """
         Constructs a detailed scene description.
 
@@ -23,106 +75,95 @@ class SceneOrchestrator:
             parsed_elements: Output from SemanticParser.
 
         Returns:
-            A dictionary representing the scene, including objects with
-            concrete properties (positions, sizes, colors from style, etc.).
-            Example: {
-                'width': 800, 'height': 600, 'background_color': '#EEEEEE',
-                'elements': [
-                    {'type': 'circle', 'cx': 100, 'cy': 100, 'r': 50, 'fill': 'blue', ...},
-                    {'type': 'rect', 'x': 200, 'y': 200, 'width': 80, 'height': 60, 'fill': 'red', ...}
-                ]
-            }
+            A Scene (see scene/elements.py) whose elements carry concrete
+            properties (positions, sizes, colors from style, etc.).
+            Example: Scene(
+                width=800, height=600, background_color='#EEEEEE',
+                elements=(
+                    CircleElement(id='element_0', cx=100, cy=100, r=50, fill='blue', ...),
+                    RectElement(id='element_1', x=200, y=200, width=80, height=60, fill='red', ...)
+                )
+            )
         """
-        logger.info(f"Orchestrating scene with {len(parsed_elements)} semantic elements and style '{self.style.name}'.")
+        logger.info("Orchestrating scene with %d semantic elements and style '%s'.", len(parsed_elements), self.style.name)
         
-        scene_description: Dict[str, Any] = {
-            "width": 800,  # Default or from style
-            "height": 600, # Default or from style
-            "background_color": self.style.background_color,
-            "elements": []
-        }
+        width = 800  # Default or from style
+        height = 600 # Default or from style
+        elements: List[SceneElement] = []
         
         # --- Placeholder Logic ---
         # This needs complex logic for layout, collision detection, z-ordering, etc.
         # For now, naively convert parsed elements to scene elements.
         
-        current_x, current_y = 50, 50 # Very basic layout progression
+        # Very basic layout progression, computed for all elements in one pass
+        kinds = [_element_kind(element_data) for element_data in parsed_elements]
+        xs, ys, widths, heights = compute_positions(kinds, self.style.is_simple, width)
         color_index = 0
+        stroke_color = self.style.stroke_color
 
-        for i, element_data in enumerate(parsed_elements):
+        for i, (element_data, kind) in enumerate(zip(parsed_elements, kinds)):
             if element_data.get("type") == "object":
                 name = element_data.get("name", "unknown")
                 attributes = element_data.get("attributes", {})
                 
                 # Determine color: specific attribute > palette cycling
                 fill_color = attributes.get("color")
-                if not fill_color:
-                    fill_color = self.style.get_color(color_index)
+                if fill_color:
+                    fill_color = sys.intern(fill_color) # Shared with every other element of this colour
+                else:
+                    fill_color = self.style.get_color(color_index) # Palette entries are interned by StyleProfile
                     color_index += 1
                 
-                scene_element: Dict[str, Any] = {
+                builder = _SHAPE_BUILDERS.get(name)
+                if builder is None:
+                    logger.warning("Unknown object name '%s' in parsed elements. Skipping for scene.", name)
+                    continue
+
+                # Presentation attributes shared by every shape kind
+                common = {
                     "id": f"element_{i}", # Basic ID
-                    "type": name, # e.g. "circle", "square"
                     "fill": fill_color,
-                    "stroke": self.style.get_color(0), # Example: first palette color for stroke
-                    "stroke-width": self.style.line_width,
+                    "stroke": stroke_color,
+                    "stroke_width": self.style.line_width,
                     "opacity": self.style.opacity
                 }
-                
-                if name == "circle":
-                    scene_element.update({
-                        "cx": current_x + 25, # Naive positioning
-                        "cy": current_y + 25,
-                        "r": 25 if self.style.shape_complexity == "simple" else 40
-                    })
-                    current_x += 60
-                elif name == "square": # Assuming 'square' implies 'rect' for SVG
-                    scene_element["type"] = "rect" # Map to SVG rect
-                    scene_element.update({
-                        "x": current_x,
-                        "y": current_y,
-                        "width": 50 if self.style.shape_complexity == "simple" else 80,
-                        "height": 50 if self.style.shape_complexity == "simple" else 80
-                    })
-                    current_x += 60 if self.style.shape_complexity == "simple" else 90
-                elif name == "sun": # Special object
-                    scene_element["type"] = "circle"
-                    scene_element.update({
-                        "cx": scene_description["width"] - 70,
-                        "cy": 70,
-                        "r": 50,
-                        "fill": attributes.get("color", "yellow") # Sun is usually yellow
-                    })
-                else:
-                    logger.warning(f"Unknown object name '{name}' in parsed elements. Skipping for scene.")
-                    continue
-
-                scene_description["elements"].append(scene_element)
+                ctx = _ShapeContext(xs[i], ys[i], widths[i], heights[i], common)
+                elements.append(builder(self.style, ctx, attributes))
             
-            elif element_data.get("type") == "unknown":
-                logger.info(f"Handling 'unknown' parsed element: {element_data.get('description')}")
+            elif kind == KIND_UNKNOWN:
+                logger.info("Handling 'unknown' parsed element: %s", element_data.get('description'))
                 # Could try to generate a placeholder text or a generic shape
-                scene_description["elements"].append({
-                    "id": f"unknown_{i}",
-                    "type": "rect", # Placeholder shape
-                    "x": current_x, "y": current_y, "width": 100, "height": 20,
-                    "fill": self.style.get_color(color_index),
+                elements.append(RectElement(
+                    id=f"unknown_{i}", # Placeholder shape
+                    x=xs[i], y=ys[i], width=widths[i], height=heights[i],
+                    fill=self.style.get_color(color_index),
                     # Here we'd ideally convert text to path, but <text> is disallowed
-                })
-                current_x += 110
+                ))
                 color_index += 1
 
 
-        if not scene_description["elements"] and parsed_elements:
+        if not elements and parsed_elements:
             # If parsing yielded something but orchestration failed to produce visual elements
              logger.warning("Scene orchestration resulted in no visual elements despite parsed input.")
-             scene_description["elements"].append({
-                 "id": "fallback_placeholder", "type": "rect", "x": 10, "y": 10,
-                 "width": scene_description["width"] - 20, "height": scene_description["height"] - 20,
-                 "fill": "none", "stroke": "#AAAAAA", "stroke-width": 2,
-                 "stroke-dasharray": "5,5" # Dashed line for placeholder
-             })
+             elements.append(RectElement(
+                 id="fallback_placeholder", x=10, y=10,
+                 width=width - 20, height=height - 20,
+                 fill="none", stroke="#AAAAAA", stroke_width=2,
+                 stroke_dasharray="5,5" # Dashed line for placeholder
+             ))
+
+
+        scene = Scene(width, height, self.style.background_color, tuple(elements))
+        logger.debug("Final scene description: %s", scene)
+        return scene
 
 
-        logger.debug(f"Final scene description: {scene_description}")
-        return scene_description
+@functools.lru_cache(maxsize=32)
+def get_orchestrator(style: StyleProfile) -> SceneOrchestrator:
+    """
+    Returns a shared SceneOrchestrator for the given style, creating it on first use.
+
+    Keyed on the StyleProfile instance; StyleProfile.load already returns one
+    instance per profile, so this yields one orchestrator per loaded style.
+    """
+    return SceneOrchestrator(style)
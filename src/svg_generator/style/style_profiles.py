@@ -1,30 +1,69 @@
 # src/svg_generator/style/style_profiles.py
+import functools
+import importlib.resources
 import json
 import os
+import sys
 from typing import Dict, Any, Optional
 import logging
 
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# Default profile location, resolved once at import rather than on every load.
+_DEFAULT_PROFILES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "style_profiles_data")
+
+
+def _read_packaged_profile(filename: str) -> bytes:
+    """Reads a profile bundled with the package; raises FileNotFoundError if there is none."""
+    resource = importlib.resources.files("svg_generator.style") / "style_profiles_data" / filename
+    return resource.read_bytes()
+
 class StyleProfile:
     """Represents a style profile loaded from a JSON configuration."""
+    __slots__ = (
+        "name", "description", "palette", "background_color", "line_width",
+        "opacity", "shape_complexity", "is_simple", "stroke_color", "_n", "_mask",
+    )
+
     def __init__(self, data: Dict[str, Any]):
         self.name: str = data.get("name", "Unnamed Profile")
         self.description: str = data.get("description", "")
-        self.palette: list[str] = data.get("palette", ["#000000"])
-        self.background_color: str = data.get("background_color", "#FFFFFF")
+        # Colours are interned so every scene element shares one string object per colour
+        self.palette: tuple[str, ...] = tuple(map(sys.intern, data.get("palette", ("#000000",))))
+        # Palette length and, for power-of-two lengths, the mask that replaces '%' in get_color
+        self._n: int = len(self.palette)
+        self._mask: Optional[int] = self._n - 1 if self._n and not (self._n & (self._n - 1)) else None
+        self.background_color: str = sys.intern(data.get("background_color", "#FFFFFF"))
         self.line_width: float = float(data.get("line_width", 1.0))
         self.opacity: float = float(data.get("opacity", 1.0))
         # Add more style attributes as needed (e.g., font, texture hints)
         self.shape_complexity: str = data.get("shape_complexity", "simple") # e.g. simple, detailed
-        self.raw_data = data # Store raw data for access to custom fields
-        logger.debug(f"StyleProfile '{self.name}' initialized.")
+        # Derived once here so scene building doesn't recompute them per scene/element
+        self.is_simple: bool = self.shape_complexity == "simple"
+        self.stroke_color: str = self.get_color(0) # Example: first palette color for stroke
+        logger.debug("StyleProfile '%s' initialized.", self.name)
 
     @classmethod
     def load(cls, profile_name: str, custom_profiles_dir: Optional[str] = None) -> 'StyleProfile':
         """
         Loads a style profile from a JSON file.
 
+        Without custom_profiles_dir, the profile is read from the package's
+        style_profiles_data directory, or from the package resources when the
+        package is not installed as plain files. A profile missing from a
+        custom directory raises FileNotFoundError; there is no fallback.
+
+        Profiles are cached per (profile_name, custom_profiles_dir), so
+        repeated loads return the same instance without touching the
+        filesystem. Call clear_cache() to pick up changes made to profile
+        files on disk.
+
         Args:
             profile_name: The name of the profile (without .json extension).
             custom_profiles_dir: Optional custom directory to look for profiles.
@@ -37,38 +76,56 @@ class StyleProfile:
             FileNotFoundError: If the profile JSON file is not found.
             json.JSONDecodeError: If the JSON is malformed.
         """
+        return cls._load_cached(profile_name, custom_profiles_dir)
+
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _load_cached(cls, profile_name: str, custom_profiles_dir: Optional[str]) -> 'StyleProfile':
+        """Reads and parses a profile file; memoized by load()."""
         filename = f"{profile_name}.json"
         
         if custom_profiles_dir:
             filepath = os.path.join(custom_profiles_dir, filename)
         else:
             # Default path: relative to this file, in a subdirectory 'style_profiles_data'
-            # This needs robust path handling for installed packages (e.g. importlib.resources)
-            base_dir = os.path.dirname(os.path.abspath(__file__))
-            filepath = os.path.join(base_dir, "style_profiles_data", filename)
-            # For now, let's assume it's relative to where cli.py searched.
-            # This part is tricky with packaging. The cli.py already attempts to find this.
+            filepath = os.path.join(_DEFAULT_PROFILES_DIR, filename)
 
-        logger.info(f"Attempting to load style profile: {filepath}")
+        logger.info("Attempting to load style profile: %s", filepath)
         try:
-            with open(filepath, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            try:
+                with open(filepath, 'rb') as f:
+                    raw = f.read()
+            except FileNotFoundError:
+                # A profile missing from a requested directory is an error for the caller
+                if custom_profiles_dir:
+                    raise
+                # Fall back to the profiles shipped as package data (works from wheels and zips too)
+                raw = _read_packaged_profile(filename)
+                logger.debug("Using packaged style profile '%s' in place of missing %s", filename, filepath)
+            data = _json_loads(raw)
             return cls(data)
         except FileNotFoundError:
-            logger.error(f"Style profile file not found: {filepath}")
+            logger.error("Style profile file not found: %s", filepath)
             raise
         except json.JSONDecodeError as e:
-            logger.error(f"Error decoding JSON from style profile '{filepath}': {e}")
+            logger.error("Error decoding JSON from style profile '%s': %s", filepath, e)
             raise
         except Exception as e:
-            logger.error(f"An unexpected error occurred while loading style profile '{filepath}': {e}")
+            logger.error("An unexpected error occurred while loading style profile '%s': %s", filepath, e)
             raise
 
+    @classmethod
+    def clear_cache(cls) -> None:
+        """Discards all cached profiles so the next load() re-reads from disk."""
+        cls._load_cached.cache_clear()
+
     def get_color(self, index: int = 0) -> str:
         """Returns a color from the palette, cycling if index is out of bounds."""
-        if not self.palette:
+        if self._mask is not None:
+            return self.palette[index & self._mask]
+        if not self._n:
             return "#000000" # Default fallback color
-        return self.palette[index % len(self.palette)]
+        return self.palette[index % self._n]
 
     def __repr__(self) -> str:
         return f"<StyleProfile name='{self.name}'>"
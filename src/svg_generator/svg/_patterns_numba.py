@@ -0,0 +1,98 @@
+# src/svg_generator/svg/_patterns_numba.py
+"""
+Numeric stripe-geometry kernel used by PatternFactory.create_stripes_pattern.
+
+The kernel is compiled with Numba when it is installed; otherwise an
+equivalent NumPy implementation is used. Both return the same corners up to
+float32 rounding.
+"""
+import math
+
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Stripe length as a multiple of the tile size, so rotated stripes cover the tile
+STRIPE_SIZE_MULTIPLIER = 3
+
+
+def _stripe_polygons_numpy(pattern_size, stripe_width, cos_a, sin_a, n_colors):
+    """NumPy version of stripe_polygons, used when Numba is not installed."""
+    total_stripe_width = stripe_width * n_colors
+    n_stripes = int(pattern_size / total_stripe_width) * 2 + 2
+    half_size = pattern_size / 2
+    half_length = pattern_size * STRIPE_SIZE_MULTIPLIER / 2
+    half_stripe = stripe_width / 2
+
+    # Centre line of every stripe before rotation
+    stripe_offsets = (np.arange(n_stripes)[:, None] * total_stripe_width
+                      + np.arange(n_colors)[None, :] * stripe_width - half_size)
+    corners = np.empty((n_stripes, n_colors, 4, 2), dtype=np.float32)
+    corners[..., 0] = (-half_length, half_length, half_length, -half_length)
+    corners[..., 1] = stripe_offsets[..., None] + (-half_stripe, -half_stripe, half_stripe, half_stripe)
+
+    rotation = np.array([[cos_a, -sin_a],
+                         [sin_a, cos_a]], dtype=np.float32)
+    return corners @ rotation.T + np.float32(half_size)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, nogil=True)
+    def _stripe_polygons_jit(pattern_size, stripe_width, cos_a, sin_a, n_colors):
+        """Numba version of stripe_polygons; writes each corner in place."""
+        total_stripe_width = stripe_width * n_colors
+        n_stripes = int(pattern_size / total_stripe_width) * 2 + 2
+        half_size = pattern_size / 2
+        half_length = pattern_size * STRIPE_SIZE_MULTIPLIER / 2
+        half_stripe = stripe_width / 2
+        # The stripe ends sit at x = -half_length / +half_length for every stripe
+        end_x = half_length * cos_a
+        end_y = half_length * sin_a
+
+        out = np.empty((n_stripes, n_colors, 4, 2), dtype=np.float32)
+        for i in range(n_stripes):
+            for j in range(n_colors):
+                offset = i * total_stripe_width + j * stripe_width - half_size
+                # Rotated, re-centred contribution of the stripe's near and far edges
+                near_x = half_size - (offset - half_stripe) * sin_a
+                near_y = half_size + (offset - half_stripe) * cos_a
+                far_x = half_size - (offset + half_stripe) * sin_a
+                far_y = half_size + (offset + half_stripe) * cos_a
+                out[i, j, 0, 0] = near_x - end_x
+                out[i, j, 0, 1] = near_y - end_y
+                out[i, j, 1, 0] = near_x + end_x
+                out[i, j, 1, 1] = near_y + end_y
+                out[i, j, 2, 0] = far_x + end_x
+                out[i, j, 2, 1] = far_y + end_y
+                out[i, j, 3, 0] = far_x - end_x
+                out[i, j, 3, 1] = far_y - end_y
+        return out
+
+    _stripe_polygons = _stripe_polygons_jit
+else:
+    _stripe_polygons = _stripe_polygons_numpy
+
+
+def stripe_polygons(pattern_size, stripe_width, cos_a, sin_a, n_colors):
+    """
+    Computes the corners of every stripe in a stripes-pattern tile.
+
+    Each stripe is a rectangle much larger than the tile, rotated about the
+    tile centre.
+
+    Args:
+        pattern_size: Side length of the square pattern tile
+        stripe_width: Width of each stripe
+        cos_a: Cosine of the stripe angle
+        sin_a: Sine of the stripe angle
+        n_colors: Number of colours the stripes cycle through
+
+    Returns:
+        float32 array of shape (stripes, n_colors, 4, 2) holding the (x, y)
+        corners of each stripe polygon in tile coordinates.
+    """
+    return _stripe_polygons(float(pattern_size), float(stripe_width), float(cos_a), float(sin_a), n_colors)
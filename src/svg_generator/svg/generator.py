@@ -1,165 +1,335 @@
 # src/svg_generator/svg/generator.py
-from typing import Dict, Any, List, Tuple
-from xml.etree.ElementTree import Element, SubElement, tostring as el_tostring
+import io
+import re
+import sys
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Sequence, TextIO, Tuple, Union
+import numpy as np
+from svg_generator.scene.elements import Scene
 from svg_generator.style.style_profiles import StyleProfile
 from svg_generator.config import MAX_RECURSION_DEPTH_GENERATION, SHAPE_COMPLEXITY_PATH_POINTS_CAP
 import logging
 
 logger = logging.getLogger(__name__)
 
+_NS_SVG = "http://www.w3.org/2000/svg"
+
+# Definition types emitted into <defs>, mapped to whether their content is
+# child elements (patterns) rather than gradient stops
+_DEF_HANDLERS: Dict[str, bool] = {
+    "linearGradient": False,
+    "radialGradient": False,
+    "pattern": True,
+}
+
+# Scenes with more top-level elements than this are built by generate_streaming
+_STREAMING_THRESHOLD = 10_000
+# Fragments buffered by generate_streaming before they are written out
+_STREAM_FLUSH_FRAGMENTS = 1024
+
+# Stack marker used by SVGGenerator._emit_elements to close a group
+_CLOSE_GROUP = object()
+
+# Presentation attributes copied from any element description. A tuple rather
+# than a set: set iteration order varies between runs with string hash
+# randomization, which would make the emitted attribute order unstable.
+_COMMON_ATTRS: Tuple[str, ...] = ("fill", "stroke", "stroke-width", "opacity", "transform")
+
+# Lower-cased background colours that need no background rectangle
+_TRANSPARENT = frozenset(("none", "transparent", ""))
+
+# Prefixes of colour and paint-server values worth interning
+_SHARED_VALUE_PREFIXES = ("#", "url(")
+
+# Geometry attributes copied verbatim for each supported leaf element;
+# polygon/polyline points are formatted separately and 'g' is handled as a container
+_TAG_ATTRS: Dict[str, Tuple[str, ...]] = {
+    "rect": ("x", "y", "width", "height", "rx", "ry"),
+    "circle": ("cx", "cy", "r"),
+    "ellipse": ("cx", "cy", "rx", "ry"),
+    "line": ("x1", "y1", "x2", "y2"),
+    "path": ("d",),
+    "polygon": (),
+    "polyline": (),
+}
+
+# Attribute values equal to the SVG initial value; emitting them only adds bytes.
+# opacity is not inherited, so "1" can be dropped anywhere; stroke-width and
+# fill-opacity are, so "1" is only dropped on top-level elements, where no
+# ancestor group can have set a different value.
+_DEFAULT_OMIT = frozenset({("opacity", "1")})
+_DEFAULT_OMIT_TOP_LEVEL = _DEFAULT_OMIT | {("stroke-width", "1"), ("fill-opacity", "1")}
+
+# Whitespace in path data that is not already a single space
+_PATH_WS_RE = re.compile(r"[^\S ]+|\s{2,}")
+
+# Characters that must be escaped inside a double-quoted attribute value
+_ATTR_ESCAPES = str.maketrans({
+    "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;",
+    "\n": "&#10;", "\r": "&#13;", "\t": "&#9;",
+})
+
+@lru_cache(maxsize=4096)
+def _escape_attr(value: str) -> str:
+    """XML-escapes an attribute value; shared fills and ids hit the cache."""
+    return value.translate(_ATTR_ESCAPES)
+
+def _escape(value: Any) -> str:
+    """Returns the value as a string, XML-escaped for use in an attribute."""
+    # Stringify before the cache lookup: 1 and 1.0 hash alike but render differently.
+    # Floats use %g, which drops trailing zeros ("1.0" -> "1") as in points lists.
+    value_type = type(value)
+    if value_type is str:
+        return _escape_attr(value)
+    return _escape_attr(format(value, "g") if value_type is float else str(value))
+
+def _attrs_to_str(attrs: Dict[str, Any]) -> str:
+    """
+    Formats attributes as the ' key="value"' run of an opening tag.
+
+    Callers build exactly one dict per element (merging with dict-spread where
+    needed) and pass it here as-is; it is read once and never copied.
+    """
+    return "".join([f' {key}="{_escape(value)}"' for key, value in attrs.items()])
+
+def _format_points(points: Any) -> str:
+    """
+    Formats (x, y) pairs as an SVG points list.
+
+    Accepts a sequence of pairs or an (N, 2) NumPy array. Coordinates use %g,
+    which drops trailing zeros and keeps six significant digits.
+    """
+    if isinstance(points, np.ndarray):
+        points = points.tolist()
+    return " ".join(map("%g,%g".__mod__, map(tuple, points)))
+
+def _close(buf: List[str], mark: int, tag: str) -> None:
+    """
+    Closes the element whose opening tag is buf[mark - 1].
+
+    If nothing was appended since the opening tag, it is turned into an
+    empty-element tag instead.
+    """
+    if len(buf) == mark:
+        buf[-1] = buf[-1][:-1] + "/>"
+    else:
+        buf.append(f"</{tag}>")
+
 class SVGGenerator:
     """
     Generates an SVG string from a structured scene description.
     This class incorporates logic from the previous ConstrainedGenerator,
     focusing on creating SVG elements based on the orchestrated scene.
+
+    Markup is appended straight into a list of string fragments and joined
+    once at the end; no intermediate element tree is built.
     """
     def __init__(self, style: StyleProfile): # Generator can also be style-aware
         self.style = style
-        self.ns = {"": "http://www.w3.org/2000/svg"} # Default namespace
+        self.ns = {"": _NS_SVG} # Default namespace
         logger.debug(f"SVGGenerator initialized with style: {self.style.name}")
 
-    def _element_to_str(self, element: Element) -> str:
-        """Converts an ElementTree element to a string with XML declaration."""
-        # ElementTree doesn't add XML declaration by default with tostring(encoding='unicode')
-        # We need a proper SVG string.
-        svg_str = el_tostring(element, encoding="unicode", method="xml")
-        # Ensure it starts with <?xml ...?> if not already present,
-        # and has the SVG doctype or namespace correctly for SVG viewers.
-        # For competition SVGs, sometimes prolog and doctype are omitted to save space.
-        # Let's create a minimal valid SVG for now.
-        return svg_str
-
-    def _create_svg_element(self, scene_desc: Dict[str, Any]) -> Element:
-        """Creates the root <svg> element."""
+    def _open_svg_element(self, buf: List[str], scene: Scene) -> None:
+        """Emits the opening root <svg> tag and the optional background."""
+        width, height = str(scene.width), str(scene.height)
         svg_attrs = {
-            "width": str(scene_desc.get("width", 800)),
-            "height": str(scene_desc.get("height", 600)),
-            "viewBox": f"0 0 {scene_desc.get('width', 800)} {scene_desc.get('height', 600)}",
-            "xmlns": self.ns[""]
+            "xmlns": _NS_SVG,
+            "width": width,
+            "height": height,
+            "viewBox": f"0 0 {width} {height}",
             # "xmlns:xlink": "http://www.w3.org/1999/xlink" # For href if needed, but often prohibited
         }
-        svg_root = Element("svg", attrib=svg_attrs)
+        buf.append(f"<svg{_attrs_to_str(svg_attrs)}>")
         
         # Optional: Add a background rectangle if specified
-        bg_color = scene_desc.get("background_color")
-        if bg_color and bg_color.lower() != "none" and bg_color.lower() != "transparent":
-            SubElement(svg_root, "rect", attrib={
-                "width": "100%",
-                "height": "100%",
-                "fill": bg_color
-            })
-        return svg_root
-
-    def _add_defs(self, svg_root: Element, scene_desc: Dict[str, Any]) -> None:
-        """Adds a <defs> section for gradients, patterns, etc."""
-        defs_elements = scene_desc.get("definitions", []) # Expecting structured defs
+        bg_color = scene.background_color
+        if bg_color and bg_color.lower() not in _TRANSPARENT:
+            buf.append(f'<rect width="100%" height="100%" fill="{_escape(bg_color)}"/>')
+
+    def _emit_defs(self, buf: List[str], scene: Scene) -> None:
+        """Emits a <defs> section for gradients, patterns, etc."""
+        defs_elements = scene.definitions # Expecting structured defs
         if not defs_elements:
             return
 
-        defs_tag = SubElement(svg_root, "defs")
+        buf.append("<defs>")
+        defs_mark = len(buf)
         for definition in defs_elements:
             def_type = definition.get("type")
             def_id = definition.get("id")
             if not def_type or not def_id:
                 continue
 
-            if def_type == "linearGradient":
-                grad_attrs = {"id": def_id}
-                grad_attrs.update(definition.get("attributes", {})) # x1, y1, x2, y2, gradientTransform
-                gradient_el = SubElement(defs_tag, "linearGradient", attrib=grad_attrs)
-                for stop in definition.get("stops", []):
-                    SubElement(gradient_el, "stop", attrib=stop) # offset, stop-color, stop-opacity
-            elif def_type == "radialGradient":
-                grad_attrs = {"id": def_id}
-                grad_attrs.update(definition.get("attributes", {})) # cx, cy, r, fx, fy, gradientTransform
-                gradient_el = SubElement(defs_tag, "radialGradient", attrib=grad_attrs)
+            has_children = _DEF_HANDLERS.get(def_type)
+            if has_children is None:
+                continue
+
+            # Gradients: x1, y1, x2, y2 / cx, cy, r, fx, fy, gradientTransform
+            # Patterns: x, y, width, height, patternUnits
+            def_attrs = {"id": def_id, **definition.get("attributes", {})}
+            buf.append(f"<{def_type}{_attrs_to_str(def_attrs)}>")
+            mark = len(buf)
+            if has_children: # Add the pattern content from children
+                self._emit_elements(buf, definition.get("children", []), def_type)
+            else:
                 for stop in definition.get("stops", []):
-                    SubElement(gradient_el, "stop", attrib=stop) # offset, stop-color, stop-opacity
-            elif def_type == "pattern":
-                pattern_attrs = {"id": def_id}
-                pattern_attrs.update(definition.get("attributes", {})) # x, y, width, height, patternUnits
-                pattern_el = SubElement(defs_tag, "pattern", attrib=pattern_attrs)
-                # Add the pattern content from children
-                for child in definition.get("children", []):
-                    self._add_element(pattern_el, child)
-
-    def _add_element(self, parent_el: Element, element_desc: Dict[str, Any], depth: int = 0) -> None:
-        """Adds a single SVG element (shape, group) to the parent."""
-        if depth > MAX_RECURSION_DEPTH_GENERATION:
-            logger.warning(f"Max recursion depth {MAX_RECURSION_DEPTH_GENERATION} reached for element: {element_desc.get('id')}")
-            return
+                    buf.append(f"<stop{_attrs_to_str(stop)}/>") # offset, stop-color, stop-opacity
+            _close(buf, mark, def_type)
+        _close(buf, defs_mark, "defs")
+
+    def _emit_elements(self, buf: List[str], element_descs: Sequence[Any], parent_tag: str = "svg") -> None:
+        """
+        Emits a sequence of element descriptions, including nested groups.
+
+        Groups are walked with an explicit stack rather than recursion. Each
+        stack entry is (element_desc, depth, parent_tag); a group pushes a
+        closing entry (_CLOSE_GROUP, mark, "g") below its children so that
+        its end tag is written once they are done.
+        """
+        stack: List[Tuple[Any, int, str]] = [(desc, 0, parent_tag) for desc in reversed(element_descs)]
+        while stack:
+            element_desc, depth, parent_tag = stack.pop()
+            if element_desc is _CLOSE_GROUP:
+                _close(buf, depth, "g") # 'depth' holds the group's buffer mark
+                continue
+            if depth > MAX_RECURSION_DEPTH_GENERATION:
+                element_id = element_desc.get('id') if isinstance(element_desc, dict) else element_desc.id
+                logger.warning(f"Max recursion depth {MAX_RECURSION_DEPTH_GENERATION} reached for element: {element_id}")
+                continue
+            children = self._emit_element(buf, element_desc, depth, parent_tag)
+            if children is not None:
+                stack.append((_CLOSE_GROUP, len(buf), "g"))
+                stack.extend([(child, depth + 1, "g") for child in reversed(children)])
+
+    def _emit_element(self, buf: List[str], element_desc: Dict[str, Any], depth: int, parent_tag: str) -> Optional[Sequence[Any]]:
+        """
+        Emits a single SVG element (shape, or the opening tag of a group) into the buffer.
+
+        Returns:
+            The group's child descriptions if a group was opened, otherwise None.
+        """
+        if not isinstance(element_desc, dict): # Typed scene element (see scene/elements.py)
+            element_desc = element_desc.to_dict()
 
         el_type = element_desc.get("type")
         if not el_type:
             logger.warning(f"Element description missing 'type': {element_desc}")
             return
         
-        attrs = {"id": element_desc.get("id", f"shape_{depth}_{parent_el.tag}")} # Basic ID
+        attrs = {"id": element_desc.get("id", f"shape_{depth}_{parent_tag}")} # Basic ID
 
         # Common attributes from description (fill, stroke, opacity, etc.)
-        common_attrs_keys = ["fill", "stroke", "stroke-width", "opacity", "transform"]
-        for key in common_attrs_keys:
-            if key in element_desc:
-                attrs[key] = str(element_desc[key])
+        default_omit = _DEFAULT_OMIT_TOP_LEVEL if depth == 0 and parent_tag == "svg" else _DEFAULT_OMIT
+        for key in _COMMON_ATTRS:
+            value = element_desc.get(key)
+            if value is not None:
+                if type(value) is str and len(value) < 64 and value.startswith(_SHARED_VALUE_PREFIXES):
+                    value = sys.intern(value) # Colours and url(#...) references repeat across elements
+                elif (key, _escape(value)) in default_omit:
+                    continue
+                attrs[key] = value
         
+        if el_type == "g": # Group; children and the end tag are handled by _emit_elements
+            buf.append(f"<g{_attrs_to_str(attrs)}>")
+            return element_desc.get("children", [])
+
         # Type-specific attributes
-        if el_type == "rect":
-            for key in ["x", "y", "width", "height", "rx", "ry"]:
-                if key in element_desc: attrs[key] = str(element_desc[key])
-        elif el_type == "circle":
-            for key in ["cx", "cy", "r"]:
-                if key in element_desc: attrs[key] = str(element_desc[key])
+        tag_attrs = _TAG_ATTRS.get(el_type)
+        if tag_attrs is None:
+            logger.warning(f"Unsupported element type '{el_type}' for direct generation. Element ID: {element_desc.get('id')}")
+            return
+        for key in tag_attrs:
+            value = element_desc.get(key)
+            if value is not None:
+                attrs[key] = value
+
+        if el_type == "path":
+            path_d = attrs.get("d", "")
+            if type(path_d) is str and path_d:
+                path_d = attrs["d"] = _PATH_WS_RE.sub(" ", path_d).strip() # Single-spaced, no newlines
+            # Rough token estimate; counting separators avoids building a token list
+            if path_d.count(" ") + 1 > SHAPE_COMPLEXITY_PATH_POINTS_CAP * 2:
+                 logger.warning(f"Path {element_desc.get('id')} data exceeds complexity cap. May be truncated by optimizer.")
         elif el_type == "polygon" or el_type == "polyline":
             points_val = element_desc.get("points")
-            if isinstance(points_val, list): # Assuming list of tuples/lists [(x1,y1), (x2,y2)]
-                attrs["points"] = " ".join([f"{p[0]},{p[1]}" for p in points_val])
+            if isinstance(points_val, (list, np.ndarray)): # [(x1,y1), (x2,y2)] or an (N, 2) array
+                attrs["points"] = _format_points(points_val)
             elif isinstance(points_val, str): # Already formatted string
                 attrs["points"] = points_val
-        elif el_type == "path":
-            path_d = element_desc.get("d", "")
-            if len(path_d.split()) > SHAPE_COMPLEXITY_PATH_POINTS_CAP * 2: # Rough estimate
-                 logger.warning(f"Path {element_desc.get('id')} data exceeds complexity cap. May be truncated by optimizer.")
-            attrs["d"] = path_d
-        elif el_type == "g": # Group
-            group_el = SubElement(parent_el, "g", attrib=attrs)
-            for child_desc in element_desc.get("children", []):
-                self._add_element(group_el, child_desc, depth + 1)
-            return # Group processed, return early
-        else:
-            logger.warning(f"Unsupported element type '{el_type}' for direct generation. Element ID: {element_desc.get('id')}")
-            return
 
-        SubElement(parent_el, el_type, attrib=attrs)
+        buf.append(f"<{el_type}{_attrs_to_str(attrs)}/>")
 
 
-    def generate(self, scene_description: Dict[str, Any]) -> str:
+    def generate(self, scene_description: Union[Scene, Dict[str, Any]]) -> str:
         """
         Generates the full SVG string from the scene description.
 
         Args:
-            scene_description: The output from SceneOrchestrator.
+            scene_description: The Scene returned by SceneOrchestrator, or an
+                equivalent dictionary with 'width', 'height', 'background_color',
+                'elements' and 'definitions' keys.
 
         Returns:
             A string containing the SVG XML.
         """
         logger.info("Generating SVG from scene description...")
+        if isinstance(scene_description, dict):
+            scene_description = Scene.from_dict(scene_description)
+
+        if len(scene_description.elements) > _STREAMING_THRESHOLD:
+            # Large scenes: accumulate in one text buffer rather than a list of fragments
+            out = io.StringIO()
+            self.generate_streaming(scene_description, out)
+            return out.getvalue()
         
-        svg_root = self._create_svg_element(scene_description)
-        self._add_defs(svg_root, scene_description) # Add definitions if any
+        buf: List[str] = []
+        self._open_svg_element(buf, scene_description)
+        svg_mark = 1 # Just past the opening <svg> tag
+        self._emit_defs(buf, scene_description) # Add definitions if any
 
         # Add main visual elements
-        elements_to_draw = scene_description.get("elements", [])
+        elements_to_draw = scene_description.elements
         if not elements_to_draw:
             logger.warning("No elements to draw in the scene description.")
             # Add a placeholder comment or visual indicator in SVG?
             # For now, just an empty SVG if no elements.
 
-        for element_desc in elements_to_draw:
-            self._add_element(svg_root, element_desc)
+        self._emit_elements(buf, elements_to_draw)
+        _close(buf, svg_mark, "svg")
             
-        # Convert the ElementTree to a string
-        # Using 'unicode' gives a string, 'bytes' for actual bytes.
-        # Optimizer and sanitizer will likely work with strings.
-        svg_string = self._element_to_str(svg_root)
+        # The sanitizer and optimizer work with strings, so join once here
+        svg_string = "".join(buf)
         logger.debug(f"SVG generation complete. Raw string length: {len(svg_string)}")
         return svg_string
+
+    def generate_streaming(self, scene_description: Union[Scene, Dict[str, Any]], out: TextIO) -> None:
+        """
+        Writes the SVG for the scene description to a text stream.
+
+        The output is identical to generate(), but fragments are written to
+        'out' in batches between top-level elements, so only a bounded part
+        of the document is held in memory at a time.
+
+        Args:
+            scene_description: A Scene or equivalent dictionary (see generate()).
+            out: A writable text stream, e.g. an open file or io.StringIO.
+        """
+        if isinstance(scene_description, dict):
+            scene_description = Scene.from_dict(scene_description)
+
+        buf: List[str] = []
+        self._open_svg_element(buf, scene_description)
+        self._emit_defs(buf, scene_description)
+        flushed = False
+        for element_desc in scene_description.elements:
+            self._emit_elements(buf, (element_desc,))
+            if len(buf) >= _STREAM_FLUSH_FRAGMENTS:
+                out.write("".join(buf))
+                buf.clear()
+                flushed = True
+
+        if flushed: # The opening <svg> tag has already been written
+            buf.append("</svg>")
+        else:
+            _close(buf, 1, "svg")
+        out.write("".join(buf))
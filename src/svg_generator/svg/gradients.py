@@ -2,11 +2,38 @@
 """
 Gradient definitions for enhanced SVG visual effects.
 """
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
+# Stop lists used when the caller supplies none, and by the rainbow preset;
+# the stop dicts are copied before they are handed out
+_DEFAULT_LINEAR_STOPS = (
+    {"offset": "0%", "stop-color": "#000000"},
+    {"offset": "100%", "stop-color": "#FFFFFF"},
+)
+_DEFAULT_RADIAL_STOPS = (
+    {"offset": "0%", "stop-color": "#FFFFFF"},
+    {"offset": "100%", "stop-color": "#000000"},
+)
+_RAINBOW_STOPS = (
+    {"offset": "0%", "stop-color": "#ff0000"},
+    {"offset": "16.67%", "stop-color": "#ffff00"},
+    {"offset": "33.33%", "stop-color": "#00ff00"},
+    {"offset": "50%", "stop-color": "#00ffff"},
+    {"offset": "66.67%", "stop-color": "#0000ff"},
+    {"offset": "83.33%", "stop-color": "#ff00ff"},
+    {"offset": "100%", "stop-color": "#ff0000"},
+)
+
+@lru_cache(maxsize=1024)
+def _num2str(value: float) -> str:
+    """Formats a gradient coordinate with %g ("0" rather than "0.0"); strings such as "50%" pass through."""
+    return value if isinstance(value, str) else format(value, "g")
+
 class GradientFactory:
     """
     Factory for creating gradient definitions for SVG elements.
@@ -37,15 +64,12 @@ class GradientFactory:
             "type": "linearGradient",
             "id": id,
             "attributes": {
-                "x1": str(x1),
-                "y1": str(y1),
-                "x2": str(x2),
-                "y2": str(y2)
+                "x1": _num2str(x1),
+                "y1": _num2str(y1),
+                "x2": _num2str(x2),
+                "y2": _num2str(y2)
             },
-            "stops": stops or [
-                {"offset": "0%", "stop-color": "#000000"},
-                {"offset": "100%", "stop-color": "#FFFFFF"}
-            ]
+            "stops": list(stops) if stops else [dict(stop) for stop in _DEFAULT_LINEAR_STOPS]
         }
         
         return gradient_def
@@ -70,24 +94,21 @@ class GradientFactory:
             Dictionary representing the radial gradient definition
         """
         attributes = {
-            "cx": str(cx),
-            "cy": str(cy),
-            "r": str(r)
+            "cx": _num2str(cx),
+            "cy": _num2str(cy),
+            "r": _num2str(r)
         }
         
         if fx is not None:
-            attributes["fx"] = str(fx)
+            attributes["fx"] = _num2str(fx)
         if fy is not None:
-            attributes["fy"] = str(fy)
+            attributes["fy"] = _num2str(fy)
             
         gradient_def = {
             "type": "radialGradient",
             "id": id,
             "attributes": attributes,
-            "stops": stops or [
-                {"offset": "0%", "stop-color": "#FFFFFF"},
-                {"offset": "100%", "stop-color": "#000000"}
-            ]
+            "stops": list(stops) if stops else [dict(stop) for stop in _DEFAULT_RADIAL_STOPS]
         }
         
         return gradient_def
@@ -104,16 +125,7 @@ class GradientFactory:
         Returns:
             Dictionary representing the rainbow linear gradient
         """
-        stops = [
-            {"offset": "0%", "stop-color": "#ff0000"},
-            {"offset": "16.67%", "stop-color": "#ffff00"},
-            {"offset": "33.33%", "stop-color": "#00ff00"},
-            {"offset": "50%", "stop-color": "#00ffff"},
-            {"offset": "66.67%", "stop-color": "#0000ff"},
-            {"offset": "83.33%", "stop-color": "#ff00ff"},
-            {"offset": "100%", "stop-color": "#ff0000"}
-        ]
-        
+        stops = [dict(stop) for stop in _RAINBOW_STOPS]
         if horizontal:
             return GradientFactory.create_linear_gradient(id, 0, 0, 1, 0, stops)
         else:
@@ -151,4 +163,4 @@ class GradientFactory:
         Returns:
             Reference string to use in fill or stroke attributes
         """
-        return f"url(#{gradient_id})"
+        return sys.intern(f"url(#{gradient_id})")  # Shared by every element that references it
@@ -2,14 +2,20 @@
 """
 Pattern generation for SVG compositions and backgrounds.
 """
-from typing import List, Dict, Any, Tuple
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Tuple
 import math
 import logging
+import sys
 
 from svg_generator.svg.shapes import ShapeFactory
+from svg_generator.svg._patterns_numba import stripe_polygons
 
 logger = logging.getLogger(__name__)
 
+# Colour values (lower-cased) for which no shape is drawn
+_TRANSPARENT = frozenset(("none", "transparent", ""))
+
 class PatternFactory:
     """
     Factory for creating SVG pattern definitions.
@@ -71,7 +77,7 @@ class PatternFactory:
         """
         # Create the background rectangle if needed
         children = []
-        if background_color.lower() != "none" and background_color.lower() != "transparent":
+        if background_color and background_color.lower() not in _TRANSPARENT:
             children.append(ShapeFactory.create_rectangle(
                 0, 0, grid_size, grid_size, 
                 fill=background_color
@@ -113,7 +119,7 @@ class PatternFactory:
         children = []
         
         # Create the background rectangle if needed
-        if background_color.lower() != "none" and background_color.lower() != "transparent":
+        if background_color and background_color.lower() not in _TRANSPARENT:
             children.append(ShapeFactory.create_rectangle(
                 0, 0, spacing, spacing, 
                 fill=background_color
@@ -151,65 +157,43 @@ class PatternFactory:
         # Calculate pattern size based on angle to ensure repeating correctly
         # This is a simplified approach that works well for common angles
         angle_rad = math.radians(angle)
-        pattern_size = stripe_width * len(colors) * max(abs(math.cos(angle_rad)), abs(math.sin(angle_rad))) * 2
+        cos_a, sin_a = math.cos(angle_rad), math.sin(angle_rad) # Reused for the stripe rotation below
+        pattern_size = stripe_width * len(colors) * max(abs(cos_a), abs(sin_a)) * 2
         
         children = []
         
         # Create background if needed
-        if background_color.lower() != "none" and background_color.lower() != "transparent":
+        if background_color and background_color.lower() not in _TRANSPARENT:
             children.append(ShapeFactory.create_rectangle(
                 0, 0, pattern_size, pattern_size, 
                 fill=background_color
             ))
         
         # Create stripes
-        # We'll create multiple stripes to cover the pattern area
-        total_stripe_width = stripe_width * len(colors)
-        for i in range(int(pattern_size / total_stripe_width) * 2 + 2):
-            stripe_pos = i * total_stripe_width
-            
-            for j, color in enumerate(colors):
-                # Skip transparent stripes
-                if color.lower() == "none" or color.lower() == "transparent":
-                    continue
-                    
-                offset = j * stripe_width
-                
-                # Create a rotated rectangle for each stripe
-                # For simplicity, we'll use a path with larger dimensions to ensure coverage
-                size_multiplier = 3  # Make the stripe much larger than pattern to ensure full coverage
-                center_x = pattern_size / 2
-                center_y = pattern_size / 2
-                
-                # Convert to path with rotation
-                rect_width = pattern_size * size_multiplier
-                rect_height = stripe_width
-                
-                # Calculate corner points of the rectangle
-                left = -rect_width / 2
-                right = rect_width / 2
-                top = -rect_height / 2 + stripe_pos + offset - pattern_size / 2
-                bottom = rect_height / 2 + stripe_pos + offset - pattern_size / 2
-                
-                # Create corners
-                corners = [
-                    (left, top),
-                    (right, top),
-                    (right, bottom),
-                    (left, bottom)
-                ]
-                
-                # Rotate corners
-                rotated_corners = []
-                for x, y in corners:
-                    rotated_x = x * math.cos(angle_rad) - y * math.sin(angle_rad) + center_x
-                    rotated_y = x * math.sin(angle_rad) + y * math.cos(angle_rad) + center_y
-                    rotated_corners.append((rotated_x, rotated_y))
-                
-                # Create path
-                children.append(ShapeFactory.create_polygon(rotated_corners, fill=color))
+        # We'll create multiple stripes to cover the pattern area; the corners
+        # are cached per geometry as immutable tuples and each polygon gets
+        # its own list of (x, y) tuples.
+        rotated_corners = PatternFactory._stripe_corners(pattern_size, stripe_width, cos_a, sin_a, len(colors))
+        
+        # Skip transparent stripes
+        visible = [j for j, color in enumerate(colors)
+                   if color and color.lower() not in _TRANSPARENT]
+        for stripe in rotated_corners:
+            for j in visible:
+                children.append(ShapeFactory.create_polygon(list(stripe[j]), fill=colors[j]))
         
         return PatternFactory.create_pattern(id, pattern_size, pattern_size, children=children)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _stripe_corners(pattern_size: float, stripe_width: float, cos_a: float, sin_a: float,
+                        n_colors: int) -> Tuple[Tuple[Tuple[Tuple[float, float], ...], ...], ...]:
+        """Stripe polygon corners (see stripe_polygons) as nested tuples, computed once per geometry."""
+        corners = stripe_polygons(pattern_size, stripe_width, cos_a, sin_a, n_colors).tolist()
+        return tuple(
+            tuple(tuple(map(tuple, polygon)) for polygon in stripe)
+            for stripe in corners
+        )
         
     @staticmethod
     def create_checkered_pattern(id: str, cell_size: float,
@@ -269,4 +253,4 @@ class PatternFactory:
         Returns:
             Reference string to use in fill or stroke attributes
         """
-        return f"url(#{pattern_id})"
+        return sys.intern(f"url(#{pattern_id})")
@@ -3,11 +3,19 @@ Renderer components for specialized SVG visualizations.
 
 This module provides various renderers for creating different types of SVG visualizations,
 including 3D grids, chord maps, text effects, and data visualizations.
+
+Renderers are imported on first access (PEP 562), so using one does not
+load the others.
 """
-from svg_generator.svg.renderers.grid3d_renderer import Grid3DRenderer
-from svg_generator.svg.renderers.chord_map_renderer import ChordMapRenderer
-from svg_generator.svg.renderers.text_renderer import TextRenderer
-from svg_generator.svg.renderers.data_viz_renderer import DataVizRenderer
+from importlib import import_module
+
+# Public renderer name -> module that defines it
+_LAZY = {
+    'Grid3DRenderer': 'svg_generator.svg.renderers.grid3d_renderer',
+    'ChordMapRenderer': 'svg_generator.svg.renderers.chord_map_renderer',
+    'TextRenderer': 'svg_generator.svg.renderers.text_renderer',
+    'DataVizRenderer': 'svg_generator.svg.renderers.data_viz_renderer',
+}
 
 __all__ = [
     'Grid3DRenderer',
@@ -15,3 +23,15 @@ __all__ = [
     'TextRenderer',
     'DataVizRenderer'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY:
+        cls = getattr(import_module(_LAZY[name]), name)
+        globals()[name] = cls  # Cache so later lookups bypass __getattr__
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
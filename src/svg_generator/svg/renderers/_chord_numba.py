@@ -0,0 +1,119 @@
+# src/svg_generator/svg/renderers/_chord_numba.py
+"""
+Numeric pair-scan kernel used by ChordMapRenderer.generate_matrix_chord_elements.
+
+The kernel is compiled with Numba when it is installed; otherwise an
+equivalent NumPy implementation is used. Both return the same arrays.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Chord direction codes returned by scan_matrix
+DIRECTION_EQUAL = 0
+DIRECTION_FORWARD = 1
+DIRECTION_BACKWARD = -1
+
+# Chord widths are the combined pair value clamped to this range
+MIN_CHORD_WIDTH = 1.0
+MAX_CHORD_WIDTH = 10.0
+
+
+def _scan_matrix_numpy(values):
+    """NumPy version of scan_matrix, used when Numba is not installed."""
+    n = values.shape[0]
+    rows, cols = np.triu_indices(n, k=1)  # Each pair once (i->j), in row order
+    forward, backward = values[rows, cols], values[cols, rows]
+
+    # Skip pairs with no relationship in either direction
+    keep = ~((forward <= 0) & (backward <= 0))
+    rows, cols, forward, backward = rows[keep], cols[keep], forward[keep], backward[keep]
+
+    combined = forward + backward
+    widths = np.clip(combined, MIN_CHORD_WIDTH, MAX_CHORD_WIDTH)
+    opacities = 0.3 + 0.7 * np.minimum(1.0, combined / 10)
+    directions = np.where(forward > backward, DIRECTION_FORWARD,
+                          np.where(backward > forward, DIRECTION_BACKWARD, DIRECTION_EQUAL))
+    return rows, cols, widths, opacities, directions
+
+
+def _scan_symmetric(values):
+    """scan_matrix for a symmetric matrix: every chord is DIRECTION_EQUAL."""
+    n = values.shape[0]
+    rows, cols = np.triu_indices(n, k=1)
+    upper = values[rows, cols]
+    keep = ~(upper <= 0)
+    rows, cols, upper = rows[keep], cols[keep], upper[keep]
+
+    combined = upper + upper
+    widths = np.clip(combined, MIN_CHORD_WIDTH, MAX_CHORD_WIDTH)
+    opacities = 0.3 + 0.7 * np.minimum(1.0, combined / 10)
+    return rows, cols, widths, opacities, np.full(rows.size, DIRECTION_EQUAL, dtype=np.int64)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _scan_matrix_jit(values):
+        """Numba version of scan_matrix; fills preallocated buffers in one pass."""
+        n = values.shape[0]
+        size = n * (n - 1) // 2
+        rows = np.empty(size, dtype=np.int64)
+        cols = np.empty(size, dtype=np.int64)
+        widths = np.empty(size, dtype=np.float64)
+        opacities = np.empty(size, dtype=np.float64)
+        directions = np.empty(size, dtype=np.int64)
+
+        count = 0
+        for i in range(n):
+            for j in range(i + 1, n):
+                forward = values[i, j]
+                backward = values[j, i]
+                if forward <= 0 and backward <= 0:
+                    continue
+                combined = forward + backward
+                rows[count] = i
+                cols[count] = j
+                widths[count] = min(max(combined, MIN_CHORD_WIDTH), MAX_CHORD_WIDTH)
+                opacities[count] = 0.3 + 0.7 * min(1.0, combined / 10)
+                if forward > backward:
+                    directions[count] = DIRECTION_FORWARD
+                elif backward > forward:
+                    directions[count] = DIRECTION_BACKWARD
+                else:
+                    directions[count] = DIRECTION_EQUAL
+                count += 1
+        return rows[:count], cols[:count], widths[:count], opacities[:count], directions[:count]
+
+    _scan_matrix = _scan_matrix_jit
+else:
+    _scan_matrix = _scan_matrix_numpy
+
+
+def scan_matrix(matrix):
+    """
+    Finds the chords of a square relationship matrix.
+
+    Each unordered pair (i, j), i < j, with a positive value in either
+    direction becomes one chord, in row order.
+
+    Args:
+        matrix: Square matrix (nested lists or array) where [i][j] is the
+            relationship from i to j
+
+    Returns:
+        Tuple of 1-D arrays (rows, cols, widths, opacities, directions), one
+        entry per chord. directions holds DIRECTION_* codes comparing
+        matrix[i][j] with matrix[j][i]; for a symmetric matrix they are all
+        DIRECTION_EQUAL.
+    """
+    values = np.asarray(matrix, dtype=np.float64)
+    n = len(values)
+    values = values.reshape(n, n)
+    # Undirected relations need only the upper triangle and no direction tests
+    if np.array_equal(values, values.T):
+        return _scan_symmetric(values)
+    return _scan_matrix(values)
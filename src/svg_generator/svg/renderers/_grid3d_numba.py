@@ -0,0 +1,66 @@
+# src/svg_generator/svg/renderers/_grid3d_numba.py
+"""
+Perspective projection kernel used by Grid3DRenderer._project_points.
+
+The kernel is compiled with Numba when it is installed; otherwise an
+equivalent NumPy implementation is used. Both perform the same operations
+in the same order, so they return identical coordinates.
+"""
+import numpy as np
+
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Depth used for points on or behind the camera plane, avoiding division by zero
+MIN_DEPTH = 0.0001
+
+
+def _project_points_numpy(points, camera, aspect, tan_half_fov, half_w, half_h):
+    """NumPy version of project_points, used when Numba is not installed."""
+    rel = points - camera
+    rel_z = np.where(rel[:, 2] <= 0, MIN_DEPTH, rel[:, 2])
+
+    projected = np.empty((len(rel), 2))
+    projected[:, 0] = (rel[:, 0] / (rel_z * tan_half_fov * aspect)) * half_w + half_w
+    projected[:, 1] = (-rel[:, 1] / (rel_z * tan_half_fov)) * half_h + half_h
+    return projected
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, nogil=True)
+    def _project_points_jit(points, camera, aspect, tan_half_fov, half_w, half_h):
+        """Numba version of project_points; projects each point in one pass."""
+        n = points.shape[0]
+        projected = np.empty((n, 2))
+        for i in range(n):
+            rel_z = points[i, 2] - camera[2]
+            if rel_z <= 0:
+                rel_z = MIN_DEPTH
+            projected[i, 0] = ((points[i, 0] - camera[0]) / (rel_z * tan_half_fov * aspect)) * half_w + half_w
+            projected[i, 1] = (-(points[i, 1] - camera[1]) / (rel_z * tan_half_fov)) * half_h + half_h
+        return projected
+
+    _project_points = _project_points_jit
+else:
+    _project_points = _project_points_numpy
+
+
+def project_points(points, camera, aspect, tan_half_fov, half_w, half_h):
+    """
+    Projects 3D points onto a 2D view plane with a simple perspective divide.
+
+    Args:
+        points: float64 array of shape (N, 3) holding [x, y, z] rows
+        camera: float64 array [x, y, z] of the camera position
+        aspect: View plane width / height
+        tan_half_fov: Tangent of half the field of view
+        half_w: Half the view plane width
+        half_h: Half the view plane height
+
+    Returns:
+        float64 array of shape (N, 2) holding the projected (x, y) rows.
+    """
+    return _project_points(points, camera, float(aspect), float(tan_half_fov), float(half_w), float(half_h))
@@ -6,10 +6,24 @@ from typing import List, Dict, Tuple, Any, Optional
 import math
 import logging
 
+import numpy as np
+
 from svg_generator.svg.shapes import ShapeFactory
+from svg_generator.svg.renderers._chord_numba import scan_matrix
 
 logger = logging.getLogger(__name__)
 
+def _f(value: float) -> str:
+    """Formats a path coordinate to two decimals, dropping trailing zeros."""
+    text = "%.2f" % value
+    return text.rstrip("0").rstrip(".")
+
+def _label_rotations(angles: np.ndarray) -> List[float]:
+    """Label rotations in degrees for entity angles in radians; labels on the left half are turned upright."""
+    degrees = angles * 180 / math.pi
+    flip = (angles > math.pi / 2) & (angles < 3 * math.pi / 2)
+    return np.where(flip, 180 + degrees, degrees).tolist()
+
 class ChordMapRenderer:
     """
     Renders chord maps for visualizing relationships between entities.
@@ -58,8 +72,6 @@ class ChordMapRenderer:
         cy = self.height / 2
         if radius is None:
             radius = min(self.width, self.height) * 0.4
-            
-        elements = []
         
         # Extract unique entities and assign them positions around the circle
         entities = set()
@@ -68,25 +80,54 @@ class ChordMapRenderer:
             entities.add(item["target"])
             
         entity_list = sorted(list(entities))
-        entity_positions = {}
         
-        for i, entity in enumerate(entity_list):
-            angle = 2 * math.pi * i / len(entity_list)
-            entity_positions[entity] = {
-                "angle": angle,
-                "x": cx + radius * math.cos(angle),
-                "y": cy + radius * math.sin(angle)
-            }
+        # Trig tables for the whole diagram, computed in one pass
+        angles = np.linspace(0, 2 * math.pi, len(entity_list), endpoint=False)
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        label_xs = (cx + (radius + 15) * cos_a).tolist()
+        label_ys = (cy + (radius + 15) * sin_a).tolist()
+        # Entity positions as parallel arrays indexed by entity ordinal, plus the
+        # chord control point for each entity (halfway towards the centre)
+        entity_xs = cx + radius * cos_a
+        entity_ys = cy + radius * sin_a
+        xs, ys = entity_xs.tolist(), entity_ys.tolist()
+        hxs = (cx + (entity_xs - cx) * 0.5).tolist()
+        hys = (cy + (entity_ys - cy) * 0.5).tolist()
+        # Path coordinates are formatted once per entity, not once per chord end
+        points = [f"{_f(px)},{_f(py)}" for px, py in zip(xs, ys)]
+        controls = [f"{_f(px)},{_f(py)}" for px, py in zip(hxs, hys)]
+        rotations = _label_rotations(angles)
+        name_to_idx = {entity: i for i, entity in enumerate(entity_list)}
+        
+        # Attributes used inside the loops below, looked up once
+        create_circle = ShapeFactory.create_circle
+        create_path_fast = ShapeFactory.create_path_fast
+        entity_fill = attrs.get("entity_fill")
+        font_size = attrs.get("font_size")
+        text_fill = attrs.get("text_fill")
+        include_text = attrs.get("include_text", False)
+        stroke = attrs.get("stroke")
+        
+        # Relationships without a positive value are skipped before any path
+        # work; ids keep their position in 'data'.
+        chords = [(i, item) for i, item in enumerate(data) if item.get("value", 1) > 0]
+        
+        # The output size is known up front: one marker (plus an optional
+        # label) per entity, followed by the chords. Elements are written into
+        # their slots instead of appended, keeping markers below the chords.
+        per_entity = 2 if include_text else 1
+        chord_start = len(entity_list) * per_entity
+        elements = [None] * (chord_start + len(chords))
             
         # Draw entity markers (circles for entities)
-        for i, (entity, pos) in enumerate(entity_positions.items()):
+        for i, entity in enumerate(entity_list):
+            slot = i * per_entity
             # Draw circle for entity
-            circle = ShapeFactory.create_circle(
-                pos["x"], pos["y"], 5,
-                fill=attrs.get("entity_fill"),
+            elements[slot] = create_circle(
+                xs[i], ys[i], 5,
+                fill=entity_fill,
                 id=f"entity_marker_{i}"
             )
-            elements.append(circle)
             
             # Text labels would typically go here, but text elements are often not
             # allowed in competition SVGs. In a real implementation, you might:
@@ -96,69 +137,52 @@ class ChordMapRenderer:
             
             # For those not using this for competitions, here's how you'd add text:
             # (This part would be converted to actual SVG during generation)
-            text_x = cx + (radius + 15) * math.cos(pos["angle"])
-            text_y = cy + (radius + 15) * math.sin(pos["angle"])
+            text_x = label_xs[i]
+            text_y = label_ys[i]
             
             # Note: this dictionary representation would need special handling
-            # in the SVGGenerator to be converted to proper <text> elements
-            text = {
-                "type": "text",
-                "id": f"entity_label_{i}",
-                "x": text_x,
-                "y": text_y,
-                "text-anchor": "middle",
-                "dominant-baseline": "middle",
-                "font-size": attrs.get("font_size"),
-                "fill": attrs.get("text_fill"),
-                "_text_content": entity  # Special field for text content
-            }
-            
-            # Add rotation for readability
-            if pos["angle"] > math.pi/2 and pos["angle"] < 3*math.pi/2:
-                text["transform"] = f"rotate({180 + pos['angle']*180/math.pi}, {text_x}, {text_y})"
-            else:
-                text["transform"] = f"rotate({pos['angle']*180/math.pi}, {text_x}, {text_y})"
-                
+            # in the SVGGenerator to be converted to proper <text> elements.
             # This would be used if text elements are allowed
-            if attrs.get("include_text", False):
-                elements.append(text)
+            if include_text:
+                elements[slot + 1] = {
+                    "type": "text",
+                    "id": f"entity_label_{i}",
+                    "x": text_x,
+                    "y": text_y,
+                    "text-anchor": "middle",
+                    "dominant-baseline": "middle",
+                    "font-size": font_size,
+                    "fill": text_fill,
+                    "_text_content": entity,  # Special field for text content
+                    # Rotated for readability
+                    "transform": f"rotate({rotations[i]}, {text_x}, {text_y})"
+                }
             
         # Draw the chords (relationship lines/curves)
-        for i, item in enumerate(data):
-            source_pos = entity_positions[item["source"]]
-            target_pos = entity_positions[item["target"]]
+        for slot, (i, item) in enumerate(chords, chord_start):
+            source = name_to_idx[item["source"]]
+            target = name_to_idx[item["target"]]
             value = item.get("value", 1)
             
             # Scale value to determine chord width
             max_width = 10
             width = max(1, min(max_width, value))
             
-            # Create a Bezier curve representing the chord
-            # Control points for the curve (toward the center)
-            cp1x = cx + (source_pos["x"] - cx) * 0.5
-            cp1y = cy + (source_pos["y"] - cy) * 0.5
-            cp2x = cx + (target_pos["x"] - cx) * 0.5
-            cp2y = cy + (target_pos["y"] - cy) * 0.5
-            
-            # Create the path data
-            path_data = f"M {source_pos['x']},{source_pos['y']} "
-            path_data += f"C {cp1x},{cp1y} {cp2x},{cp2y} {target_pos['x']},{target_pos['y']}"
-            
-            # Create the path element
-            path_attrs = {
-                "id": f"chord_{i}",
-                "d": path_data,
-                "fill": "none",
-                "stroke": attrs.get("stroke"),
-                "stroke-width": width
-            }
+            # Create a Bezier curve representing the chord, with control
+            # points toward the center (precomputed per entity)
+            path_data = f"M {points[source]} C {controls[source]} {controls[target]} {points[target]}"
             
             # Add opacity based on value
             opacity = 0.3 + (0.7 * min(1, value / 10))
-            path_attrs["opacity"] = opacity
             
-            path = ShapeFactory.create_path(path_data, **path_attrs)
-            elements.append(path)
+            # Create the path element
+            elements[slot] = create_path_fast(
+                path_data,
+                stroke=stroke,
+                width=width,
+                opacity=opacity,
+                id=f"chord_{i}"
+            )
             
         return elements
         
@@ -196,8 +220,6 @@ class ChordMapRenderer:
         cy = self.height / 2
         if radius is None:
             radius = min(self.width, self.height) * 0.4
-            
-        elements = []
         
         # Ensure matrix is square
         n = len(matrix)
@@ -212,54 +234,78 @@ class ChordMapRenderer:
             logger.error("Number of labels must match matrix dimensions")
             return []
             
-        # Calculate entity positions
-        entity_positions = []
-        for i in range(n):
-            angle = 2 * math.pi * i / n
-            entity_positions.append({
-                "angle": angle,
-                "x": cx + radius * math.cos(angle),
-                "y": cy + radius * math.sin(angle)
-            })
+        # Calculate entity positions, arc ends and label anchors in one vectorized pass
+        angles = np.linspace(0, 2 * math.pi, n, endpoint=False)
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        # Entities are already indexed, so positions are plain parallel arrays;
+        # hxs/hys are each entity's chord control point, halfway to the centre
+        entity_xs = cx + radius * cos_a
+        entity_ys = cy + radius * sin_a
+        xs, ys = entity_xs.tolist(), entity_ys.tolist()
+        hxs = (cx + (entity_xs - cx) * 0.5).tolist()
+        hys = (cy + (entity_ys - cy) * 0.5).tolist()
+        # Chord path coordinates, formatted once per entity
+        points = [f"{_f(px)},{_f(py)}" for px, py in zip(xs, ys)]
+        controls = [f"{_f(px)},{_f(py)}" for px, py in zip(hxs, hys)]
+        rotations = _label_rotations(angles)
+        arc_width = 2 * math.pi / n if n else 0.0
+        start_angles = angles - arc_width/2
+        end_angles = angles + arc_width/2
+        start_xs = (cx + radius * np.cos(start_angles)).tolist()
+        start_ys = (cy + radius * np.sin(start_angles)).tolist()
+        end_xs = (cx + radius * np.cos(end_angles)).tolist()
+        end_ys = (cy + radius * np.sin(end_angles)).tolist()
+        label_xs = (cx + (radius + 20) * cos_a).tolist()
+        label_ys = (cy + (radius + 20) * sin_a).tolist()
+        
+        # Create arc path
+        large_arc_flag = 0 if arc_width <= math.pi else 1
+        
+        # Attributes used inside the loops below, looked up once
+        create_path = ShapeFactory.create_path
+        create_path_fast = ShapeFactory.create_path_fast
+        default_entity_fill = attrs.get("entity_fill")
+        font_size = attrs.get("font_size")
+        text_fill = attrs.get("text_fill")
+        include_text = attrs.get("include_text", False)
+        
+        # The centre, radius and arc flag are the same for every segment, so
+        # those parts of the path are formatted once
+        arc_from_center = f"M {_f(cx)},{_f(cy)} L "
+        arc_sweep = f" A {_f(radius)},{_f(radius)} 0 {large_arc_flag},1 "
+        
+        # The numeric pair scan (which pairs, widths, opacities, directions)
+        # runs in a compiled kernel; only the path strings are built per chord.
+        rows, cols, widths, opacities, directions = scan_matrix(matrix)
+        
+        # One segment (plus an optional label) per entity, then the chords;
+        # elements are written into pre-sized slots in that order.
+        per_entity = 2 if include_text else 1
+        chord_start = n * per_entity
+        elements = [None] * (chord_start + len(rows))
             
         # Draw entity markers and arcs
-        for i, pos in enumerate(entity_positions):
+        for i in range(n):
+            slot = i * per_entity
             # Draw arc segment for entity
-            arc_width = 2 * math.pi / n
-            
-            # Draw arc
-            start_angle = pos["angle"] - arc_width/2
-            end_angle = pos["angle"] + arc_width/2
-            
-            # Create arc path
-            large_arc_flag = 0 if arc_width <= math.pi else 1
-            
-            start_x = cx + radius * math.cos(start_angle)
-            start_y = cy + radius * math.sin(start_angle)
-            end_x = cx + radius * math.cos(end_angle)
-            end_y = cy + radius * math.sin(end_angle)
-            
-            path_data = f"M {cx},{cy} "
-            path_data += f"L {start_x},{start_y} "
-            path_data += f"A {radius},{radius} 0 {large_arc_flag},1 {end_x},{end_y} "
-            path_data += f"Z"
+            path_data = (f"{arc_from_center}{_f(start_xs[i])},{_f(start_ys[i])}"
+                         f"{arc_sweep}{_f(end_xs[i])},{_f(end_ys[i])} Z")
             
             # Create the arc element
-            entity_color = attrs.get(f"entity_fill_{i}", attrs.get("entity_fill"))
-            arc_path = ShapeFactory.create_path(
+            entity_color = attrs.get(f"entity_fill_{i}", default_entity_fill)
+            elements[slot] = create_path(
                 path_data,
                 fill=entity_color,
                 stroke="none",
                 id=f"entity_segment_{i}"
             )
-            elements.append(arc_path)
             
             # Add text label (if using text elements)
-            text_x = cx + (radius + 20) * math.cos(pos["angle"])
-            text_y = cy + (radius + 20) * math.sin(pos["angle"])
+            text_x = label_xs[i]
+            text_y = label_ys[i]
             
             # Similar to the chord diagram, text handling would depend on requirements
-            if attrs.get("include_text", False):
+            if include_text:
                 text = {
                     "type": "text",
                     "id": f"entity_label_{i}",
@@ -267,68 +313,31 @@ class ChordMapRenderer:
                     "y": text_y,
                     "text-anchor": "middle",
                     "dominant-baseline": "middle",
-                    "font-size": attrs.get("font_size"),
-                    "fill": attrs.get("text_fill"),
-                    "_text_content": labels[i]
+                    "font-size": font_size,
+                    "fill": text_fill,
+                    "_text_content": labels[i],
+                    # Rotated for readability
+                    "transform": f"rotate({rotations[i]}, {text_x}, {text_y})"
                 }
                 
-                # Add rotation for readability
-                if pos["angle"] > math.pi/2 and pos["angle"] < 3*math.pi/2:
-                    text["transform"] = f"rotate({180 + pos['angle']*180/math.pi}, {text_x}, {text_y})"
-                else:
-                    text["transform"] = f"rotate({pos['angle']*180/math.pi}, {text_x}, {text_y})"
-                    
-                elements.append(text)
+                elements[slot + 1] = text
             
         # Draw chords based on matrix values
-        for i in range(n):
-            for j in range(i+1, n):  # Only process each pair once (i->j)
-                value_ij = matrix[i][j]
-                value_ji = matrix[j][i]
-                
-                # Skip if no relationship exists in either direction
-                if value_ij <= 0 and value_ji <= 0:
-                    continue
-                    
-                # Draw chord based on combined values
-                combined_value = value_ij + value_ji
-                
-                # Scale value to determine chord width
-                max_width = 10
-                width = max(1, min(max_width, combined_value))
-                
-                source_pos = entity_positions[i]
-                target_pos = entity_positions[j]
-                
-                # Control points for the curve
-                cp1x = cx + (source_pos["x"] - cx) * 0.5
-                cp1y = cy + (source_pos["y"] - cy) * 0.5
-                cp2x = cx + (target_pos["x"] - cx) * 0.5
-                cp2y = cy + (target_pos["y"] - cy) * 0.5
-                
-                # Create the path data
-                path_data = f"M {source_pos['x']},{source_pos['y']} "
-                path_data += f"C {cp1x},{cp1y} {cp2x},{cp2y} {target_pos['x']},{target_pos['y']}"
-                
-                # Determine color based on relationship direction
-                chord_color = attrs.get("equal_color")
-                if value_ij > value_ji:
-                    chord_color = attrs.get("forward_color")
-                elif value_ji > value_ij:
-                    chord_color = attrs.get("backward_color")
-                
-                # Add opacity based on value
-                opacity = 0.3 + (0.7 * min(1, combined_value / 10))
-                
-                # Create the path element
-                path = ShapeFactory.create_path(
-                    path_data,
-                    id=f"chord_{i}_{j}",
-                    fill="none",
-                    stroke=chord_color,
-                    stroke_width=width,
-                    opacity=opacity
-                )
-                elements.append(path)
-                
+        # Indexed by direction code: equal (0), forward (1), backward (-1)
+        chord_colors = (attrs.get("equal_color"), attrs.get("forward_color"), attrs.get("backward_color"))
+        
+        chord_rows = zip(rows.tolist(), cols.tolist(), widths.tolist(), opacities.tolist(), directions.tolist())
+        for slot, (i, j, width, opacity, direction) in enumerate(chord_rows, chord_start):
+            # Create the path data
+            path_data = f"M {points[i]} C {controls[i]} {controls[j]} {points[j]}"
+            
+            # Create the path element
+            elements[slot] = create_path_fast(
+                path_data,
+                stroke=chord_colors[direction],
+                width=width,
+                opacity=opacity,
+                id=f"chord_{i}_{j}"
+            )
+            
         return elements
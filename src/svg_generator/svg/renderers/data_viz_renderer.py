@@ -2,16 +2,28 @@
 """
 Data visualization renderer for SVG generation.
 """
-import math
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional, Union
 
+import numpy as np
+
 from svg_generator.svg.shapes import ShapeFactory
 from svg_generator.utils.colors import ColorUtils
 from svg_generator.utils.text_utils import TextUtils
 
 logger = logging.getLogger(__name__)
 
+def _f(value: float) -> str:
+    """Formats a path coordinate with at most two decimals ("92.15", "400")."""
+    text = "%.2f" % value
+    return text.rstrip("0").rstrip(".")
+
+@lru_cache(maxsize=256)
+def _palette(base_color: str, count: int, scheme: str) -> Tuple[str, ...]:
+    """Default chart colours; repeated renders with the same base colour reuse one palette."""
+    return tuple(ColorUtils.generate_palette(base_color, count, scheme))
+
 class DataVizRenderer:
     """
     Renders data visualizations as SVG elements.
@@ -38,73 +50,86 @@ class DataVizRenderer:
         bar_count = len(data)
         padding = 0.2  # Space between bars (20% of bar width)
         bar_width = width / (bar_count * (1 + padding))
-        max_value = max(data)
+        values = np.asarray(data, dtype=np.float64)
+        max_value = float(values.max())
         
         # Generate colors if not provided
         if not colors:
             base_color = attributes.get('fill', '#3366cc')
-            colors = ColorUtils.generate_palette(base_color, bar_count, 'analogous')
+            colors = _palette(base_color, bar_count, 'analogous')
         
         elements = []
         
         # Draw background/frame if specified
         if attributes.get('show_frame', True):
-            frame = ShapeFactory.create_rect(
+            frame = ShapeFactory.create_rectangle(
                 x, y, width, height,
                 fill="none", 
                 stroke=attributes.get('frame_stroke', '#cccccc'),
                 stroke_width=attributes.get('frame_stroke_width', '1')
             )
             elements.append(frame)
+        
+        # Only positive values are drawn; with none there is nothing to scale
+        if max_value <= 0:
+            return elements
             
+        # Attributes used below, looked up once
+        create_rectangle = ShapeFactory.create_rectangle
+        create_text_element = TextUtils.create_text_element
+        stroke = attributes.get('stroke', 'none')
+        stroke_width = attributes.get('stroke_width', '0')
+        font_size = attributes.get('font_size', 12)
+        font_family = attributes.get('font_family', 'Arial')
+        text_fill = attributes.get('text_fill', '#333333')
+        
+        # Bar geometry for all bars at once; zero or negative values are skipped
+        bar_heights = (values / max_value) * height
+        bar_xs = x + np.arange(bar_count) * bar_width * (1 + padding)
+        bar_ys = y + height - bar_heights
+        drawn = np.flatnonzero(values > 0).tolist()
+        bar_heights, bar_xs, bar_ys = bar_heights.tolist(), bar_xs.tolist(), bar_ys.tolist()
+        
         # Draw bars
-        for i, value in enumerate(data):
-            # Skip zero or negative values
-            if value <= 0:
-                continue
-                
-            # Calculate bar height and position
-            bar_height = (value / max_value) * height
-            bar_x = x + i * bar_width * (1 + padding)
-            bar_y = y + height - bar_height
-            
-            # Create bar element
-            bar = ShapeFactory.create_rect(
-                bar_x, bar_y, bar_width, bar_height,
+        elements.extend([
+            create_rectangle(
+                bar_xs[i], bar_ys[i], bar_width, bar_heights[i],
                 fill=colors[i % len(colors)],
-                stroke=attributes.get('stroke', 'none'),
-                stroke_width=attributes.get('stroke_width', '0')
+                stroke=stroke,
+                stroke_width=stroke_width
             )
-            elements.append(bar)
-            
-            # Add value label if requested
-            if show_values:
-                # Create text for value
-                value_str = str(round(value, 1))
-                
-                text_element = TextUtils.create_text_element(
-                    text=value_str,
-                    x=bar_x + bar_width/2,
-                    y=bar_y - 5,
-                    font_size=attributes.get('font_size', 12),
-                    font_family=attributes.get('font_family', 'Arial'),
-                    fill=attributes.get('text_fill', '#333333'),
+            for i in drawn
+        ])
+        
+        # Add value labels if requested
+        if show_values:
+            elements.extend([
+                create_text_element(
+                    text=str(round(data[i], 1)),
+                    x=bar_xs[i] + bar_width/2,
+                    y=bar_ys[i] - 5,
+                    font_size=font_size,
+                    font_family=font_family,
+                    fill=text_fill,
                     text_anchor='middle'
                 )
-                elements.append(text_element)
-            
-            # Add label if provided
-            if labels and i < len(labels):
-                label_text = TextUtils.create_text_element(
+                for i in drawn
+            ])
+        
+        # Add labels if provided
+        if labels:
+            elements.extend([
+                create_text_element(
                     text=labels[i],
-                    x=bar_x + bar_width/2,
+                    x=bar_xs[i] + bar_width/2,
                     y=y + height + 15,
-                    font_size=attributes.get('font_size', 12),
-                    font_family=attributes.get('font_family', 'Arial'),
-                    fill=attributes.get('text_fill', '#333333'),
+                    font_size=font_size,
+                    font_family=font_family,
+                    fill=text_fill,
                     text_anchor='middle'
                 )
-                elements.append(label_text)
+                for i in drawn if i < len(labels)
+            ])
                 
         return elements
     
@@ -115,79 +140,85 @@ class DataVizRenderer:
                          colors: Optional[List[str]] = None,
                          **attributes) -> List[Dict[str, Any]]:
         """Generate a pie chart visualization."""
-        if not data or sum(data) == 0:
+        if not data:
+            return []
+        values = np.asarray(data, dtype=np.float64)
+        total = float(values.sum())
+        if total == 0:
             return []
             
         # Generate colors if not provided
         if not colors:
             base_color = attributes.get('fill', '#3366cc')
-            colors = ColorUtils.generate_palette(base_color, len(data), 'analogous')
+            colors = _palette(base_color, len(data), 'analogous')
         
         elements = []
-        total = sum(data)
         
-        # Track starting angle
+        # Angle of the first slice's leading edge, in degrees
         start_angle = attributes.get('start_angle', 0)
         
+        # Attributes used inside the loop below, looked up once
+        create_path = ShapeFactory.create_path
+        stroke = attributes.get('stroke', '#ffffff')
+        stroke_width = attributes.get('stroke_width', '1')
+        skip_text = attributes.get('skip_text', False)
+        font_size = attributes.get('font_size', 12)
+        font_family = attributes.get('font_family', 'Arial')
+        
+        # Slice boundary angles and their points on the circle, all at once.
+        # Zero or negative values get an empty slice and are skipped below.
+        drawn = values > 0
+        slice_angles = np.where(drawn, (values / total) * 360, 0.0)
+        boundaries = np.cumsum(np.concatenate(([start_angle], slice_angles)))
+        boundary_rad = np.radians(boundaries)
+        # Each boundary point ends one slice and starts the next, so format it once
+        edges = [f"{_f(edge_x)},{_f(edge_y)}"
+                 for edge_x, edge_y in zip((cx + radius * np.cos(boundary_rad)).tolist(),
+                                           (cy + radius * np.sin(boundary_rad)).tolist())]
+        # Labels sit at the middle of each slice, inside it
+        label_radius = radius * 0.7
+        label_rad = np.radians(boundaries[:-1] + slice_angles / 2)
+        label_xs = (cx + label_radius * np.cos(label_rad)).tolist()
+        label_ys = (cy + label_radius * np.sin(label_rad)).tolist()
+        large_arcs = (slice_angles > 180).tolist()
+        
+        # Constant parts of every slice path; the arc command is indexed by its large-arc flag
+        slice_from_center = f"M {_f(cx)},{_f(cy)} L "
+        slice_sweeps = (f" A {_f(radius)},{_f(radius)} 0 0,1 ", f" A {_f(radius)},{_f(radius)} 0 1,1 ")
+        
         # Draw pie slices
-        for i, value in enumerate(data):
-            # Skip zero or negative values
-            if value <= 0:
-                continue
-                
-            # Calculate slice angles
-            slice_angle = (value / total) * 360
-            end_angle = start_angle + slice_angle
-            
-            # Create slice path
-            large_arc = 1 if slice_angle > 180 else 0
-            
-            # Calculate start and end points
-            start_x = cx + radius * math.cos(math.radians(start_angle))
-            start_y = cy + radius * math.sin(math.radians(start_angle))
-            end_x = cx + radius * math.cos(math.radians(end_angle))
-            end_y = cy + radius * math.sin(math.radians(end_angle))
-            
+        for i in np.flatnonzero(drawn).tolist():
             # Create path
-            path_data = f"M {cx},{cy} L {start_x},{start_y} "
-            path_data += f"A {radius},{radius} 0 {large_arc},1 {end_x},{end_y} Z"
+            path_data = f"{slice_from_center}{edges[i]}{slice_sweeps[large_arcs[i]]}{edges[i + 1]} Z"
             
             # Create slice element
             slice_color = colors[i % len(colors)]
-            slice_element = ShapeFactory.create_path(
+            slice_element = create_path(
                 path_data,
                 fill=slice_color,
-                stroke=attributes.get('stroke', '#ffffff'),
-                stroke_width=attributes.get('stroke_width', '1')
+                stroke=stroke,
+                stroke_width=stroke_width
             )
             elements.append(slice_element)
             
             # Add label if provided
             if labels and i < len(labels):
-                # Position label at the middle of the slice
-                label_angle = start_angle + slice_angle / 2
-                label_radius = radius * 0.7  # Position inside the slice
-                
-                label_x = cx + label_radius * math.cos(math.radians(label_angle))
-                label_y = cy + label_radius * math.sin(math.radians(label_angle))
+                label_x, label_y = label_xs[i], label_ys[i]
                 
                 # Create text element
                 # For competition SVGs, consider skipping text elements
-                if not attributes.get('skip_text', False):
+                if not skip_text:
                     text_element = TextUtils.create_text_element(
                         text=labels[i],
                         x=label_x,
                         y=label_y,
-                        font_size=attributes.get('font_size', 12),
-                        font_family=attributes.get('font_family', 'Arial'),
+                        font_size=font_size,
+                        font_family=font_family,
                         fill=ColorUtils.get_contrast_color(slice_color),
                         text_anchor='middle',
                         dominant_baseline='middle'
                     )
                     elements.append(text_element)
-            
-            # Update start angle for next slice
-            start_angle = end_angle
                 
         return elements
     
@@ -217,11 +248,11 @@ class DataVizRenderer:
         # Generate colors if not provided
         if not colors:
             base_color = attributes.get('fill', '#3366cc')
-            colors = ColorUtils.generate_palette(base_color, len(data_series), 'analogous')
+            colors = _palette(base_color, len(data_series), 'analogous')
         
         # Draw background/frame if specified
         if attributes.get('show_frame', True):
-            frame = ShapeFactory.create_rect(
+            frame = ShapeFactory.create_rectangle(
                 x, y, width, height,
                 fill="none", 
                 stroke=attributes.get('frame_stroke', '#cccccc'),
@@ -229,23 +260,31 @@ class DataVizRenderer:
             )
             elements.append(frame)
             
+        # Attributes used inside the loops below, looked up once
+        create_circle = ShapeFactory.create_circle
+        line_width = attributes.get('stroke_width', '2')
+        point_radius = attributes.get('point_radius', 4)
+        point_fill = attributes.get('point_fill', '#ffffff')
+        point_stroke_width = attributes.get('point_stroke_width', '2')
+        
         # Draw each data series
+        y_scale = height / (max_value - min_value)
         for series_idx, series in enumerate(data_series):
             if not series:
                 continue
                 
-            points = []
-            for i, value in enumerate(series):
-                # Calculate point position
-                point_x = x + (i / (len(series) - 1)) * width if len(series) > 1 else x
-                point_y = y + height - ((value - min_value) / (max_value - min_value)) * height
-                
-                points.append((point_x, point_y))
+            # Calculate all point positions at once
+            values = np.asarray(series, dtype=np.float64)
+            if values.size > 1:
+                point_xs = x + np.arange(values.size) * (width / (values.size - 1))
+            else:
+                point_xs = np.full(1, x, dtype=np.float64)
+            point_ys = y + height - (values - min_value) * y_scale
+            points = list(zip(point_xs.tolist(), point_ys.tolist()))
                 
             # Create path for the line
-            path_data = f"M {points[0][0]},{points[0][1]}"
-            for point in points[1:]:
-                path_data += f" L {point[0]},{point[1]}"
+            # Joined once; repeated += would copy the growing string per point
+            path_data = "M " + " L ".join([f"{_f(point_x)},{_f(point_y)}" for point_x, point_y in points])
                 
             # Create line element
             line_color = colors[series_idx % len(colors)]
@@ -253,40 +292,42 @@ class DataVizRenderer:
                 path_data,
                 fill="none",
                 stroke=line_color,
-                stroke_width=attributes.get('stroke_width', '2')
+                stroke_width=line_width
             )
             elements.append(line_element)
             
             # Add points if requested
             if show_points:
                 for point_x, point_y in points:
-                    point_element = ShapeFactory.create_circle(
+                    point_element = create_circle(
                         point_x, point_y, 
-                        radius=attributes.get('point_radius', 4),
-                        fill=attributes.get('point_fill', '#ffffff'),
+                        radius=point_radius,
+                        fill=point_fill,
                         stroke=line_color,
-                        stroke_width=attributes.get('point_stroke_width', '2')
+                        stroke_width=point_stroke_width
                     )
                     elements.append(point_element)
         
         # Add x-axis labels if provided
         if x_labels:
             label_spacing = width / (len(x_labels) - 1) if len(x_labels) > 1 else width
+            font_size = attributes.get('font_size', 12)
+            font_family = attributes.get('font_family', 'Arial')
+            text_fill = attributes.get('text_fill', '#333333')
             
-            for i, label in enumerate(x_labels):
-                label_x = x + i * label_spacing
-                label_y = y + height + 15
-                
-                label_element = TextUtils.create_text_element(
+            label_y = y + height + 15
+            elements.extend([
+                TextUtils.create_text_element(
                     text=label,
-                    x=label_x,
+                    x=x + i * label_spacing,
                     y=label_y,
-                    font_size=attributes.get('font_size', 12),
-                    font_family=attributes.get('font_family', 'Arial'),
-                    fill=attributes.get('text_fill', '#333333'),
+                    font_size=font_size,
+                    font_family=font_family,
+                    fill=text_fill,
                     text_anchor='middle'
                 )
-                elements.append(label_element)
+                for i, label in enumerate(x_labels)
+            ])
                 
         return elements
     
@@ -301,11 +342,14 @@ class DataVizRenderer:
             
         elements = []
         
+        xv = np.asarray(x_values, dtype=np.float64)
+        yv = np.asarray(y_values, dtype=np.float64)
+        
         # Find min and max values
-        min_x = min(x_values)
-        max_x = max(x_values)
-        min_y = min(y_values)
-        max_y = max(y_values)
+        min_x = float(xv.min())
+        max_x = float(xv.max())
+        min_y = float(yv.min())
+        max_y = float(yv.max())
         
         # Adjust ranges for better visualization
         x_range = max_x - min_x
@@ -318,7 +362,7 @@ class DataVizRenderer:
         
         # Draw background/frame if specified
         if attributes.get('show_frame', True):
-            frame = ShapeFactory.create_rect(
+            frame = ShapeFactory.create_rectangle(
                 x, y, width, height,
                 fill="none", 
                 stroke=attributes.get('frame_stroke', '#cccccc'),
@@ -326,20 +370,24 @@ class DataVizRenderer:
             )
             elements.append(frame)
             
+        # Calculate all point positions in one pass
+        point_xs = x + (xv - min_x) * (width / (max_x - min_x))
+        point_ys = y + height - (yv - min_y) * (height / (max_y - min_y))
+        
         # Draw each data point
-        for i in range(len(x_values)):
-            # Calculate point position
-            point_x = x + ((x_values[i] - min_x) / (max_x - min_x)) * width
-            point_y = y + height - ((y_values[i] - min_y) / (max_y - min_y)) * height
-            
-            # Create point element
-            point_element = ShapeFactory.create_circle(
+        create_circle = ShapeFactory.create_circle
+        point_radius = attributes.get('point_radius', 5)
+        stroke = attributes.get('stroke', 'none')
+        stroke_width = attributes.get('stroke_width', '0')
+        elements.extend([
+            create_circle(
                 point_x, point_y, 
-                radius=attributes.get('point_radius', 5),
+                radius=point_radius,
                 fill=color,
-                stroke=attributes.get('stroke', 'none'),
-                stroke_width=attributes.get('stroke_width', '0')
+                stroke=stroke,
+                stroke_width=stroke_width
             )
-            elements.append(point_element)
+            for point_x, point_y in zip(point_xs.tolist(), point_ys.tolist())
+        ])
                 
         return elements
@@ -2,14 +2,45 @@
 """
 3D grid rendering for SVG with perspective effects.
 """
-from typing import List, Dict, Any, Tuple
+from typing import List, Dict, Any, Tuple, Callable
 import math
 import logging
 
+import numpy as np
+
 from svg_generator.svg.shapes import ShapeFactory
+from svg_generator.svg.renderers._grid3d_numba import project_points
 
 logger = logging.getLogger(__name__)
 
+# Unit cube corners (scaled by half the cube size) and the vertex pairs of its edges
+_CUBE_OFFSETS = np.array([
+    [-1, -1, -1],  # 0: front bottom left
+    [1, -1, -1],   # 1: front bottom right
+    [1, 1, -1],    # 2: front top right
+    [-1, 1, -1],   # 3: front top left
+    [-1, -1, 1],   # 4: back bottom left
+    [1, -1, 1],    # 5: back bottom right
+    [1, 1, 1],     # 6: back top right
+    [-1, 1, 1]     # 7: back top left
+], dtype=np.float64)
+_CUBE_EDGES = np.array([
+    # Front face
+    (0, 1), (1, 2), (2, 3), (3, 0),
+    # Back face
+    (4, 5), (5, 6), (6, 7), (7, 4),
+    # Connecting edges
+    (0, 4), (1, 5), (2, 6), (3, 7)
+], dtype=np.int32)
+
+# Most cube projectors kept per renderer before the cache is reset
+_MAX_CUBE_PROJECTORS = 128
+
+def _f(value: float) -> str:
+    """Formats a ring path coordinate to two decimals, dropping trailing zeros."""
+    text = "%.2f" % value
+    return text.rstrip("0").rstrip(".")
+
 class Grid3DRenderer:
     """
     Renders 3D grid structures in SVG with perspective effects.
@@ -41,6 +72,14 @@ class Grid3DRenderer:
         self.camera_target = [0, 0, 0]
         self.camera_up = [0, 1, 0]
         
+        # Camera array and projection constants, derived from the attributes
+        # above and refreshed whenever they change (see _refresh_projection)
+        self._projection_key = None
+        self._refresh_projection()
+        
+        # Cube projectors, keyed by the projection key and the cube center
+        self._cube_projectors: Dict[Tuple[Any, ...], Callable[[float], Tuple[np.ndarray, np.ndarray]]] = {}
+        
         logger.debug(f"Grid3DRenderer initialized: {width}x{height}, FOV: {fov}")
         
     def _project_point(self, point: List[float]) -> Tuple[float, float]:
@@ -63,13 +102,109 @@ class Grid3DRenderer:
             rel_z = 0.0001
             
         # Perspective division
-        aspect = self.width / self.height
-        scale = math.tan(self.fov / 2)
+        scale = self._tan_half_fov
+        half_w, half_h = self._half_w, self._half_h
         
-        projected_x = (rel_x / (rel_z * scale * aspect)) * (self.width / 2) + (self.width / 2)
-        projected_y = (-rel_y / (rel_z * scale)) * (self.height / 2) + (self.height / 2)
+        projected_x = (rel_x / (rel_z * scale * self._aspect)) * half_w + half_w
+        projected_y = (-rel_y / (rel_z * scale)) * half_h + half_h
         
         return (projected_x, projected_y)
+
+    def _project_points(self, points: np.ndarray) -> np.ndarray:
+        """
+        Project many 3D points onto the 2D canvas at once.
+        
+        Same projection as _project_point, applied to every row of an array
+        by a compiled kernel (see _grid3d_numba).
+        
+        Args:
+            points: Array of shape (N, 3) holding [x, y, z] rows
+            
+        Returns:
+            Array of shape (N, 2) holding the projected (x, y) rows
+        """
+        points = np.ascontiguousarray(points, dtype=np.float64).reshape(-1, 3)
+        return project_points(points, self._camera, self._aspect, self._tan_half_fov,
+                              self._half_w, self._half_h)
+
+    def _visible_mask(self, points: np.ndarray, projected: np.ndarray) -> np.ndarray:
+        """
+        Flag which primitives (lines, ring outlines) may be visible.
+        
+        A primitive is culled when all of its points lie behind the camera,
+        or when all of its projected points lie beyond the same edge of the
+        canvas. The test is conservative: anything that could cross the
+        canvas is kept.
+        
+        Args:
+            points: Array of shape (N, K, 3), the K 3D points of each of N primitives
+            projected: Array of shape (N, K, 2), the same points after projection
+            
+        Returns:
+            Boolean array of shape (N,), True for primitives to draw
+        """
+        behind = (points[..., 2] - self._camera[2] <= 0).all(axis=1)
+        xs, ys = projected[..., 0], projected[..., 1]
+        offscreen = ((xs < 0).all(axis=1) | (xs > self.width).all(axis=1)
+                     | (ys < 0).all(axis=1) | (ys > self.height).all(axis=1))
+        return ~(behind | offscreen)
+
+    def _refresh_projection(self) -> None:
+        """
+        Re-derives the cached camera array and projection constants.
+        
+        Called once at the start of every generate_* call, so assigning or
+        mutating camera_pos, width, height or fov takes effect on the next
+        render; the values are only recomputed when one of them changed.
+        _project_point, _project_points and _cube_projector use the values
+        as of that call.
+        """
+        key = (tuple(self.camera_pos), self.width, self.height, self.fov)
+        if key == self._projection_key:
+            return
+        self._projection_key = key
+        self._camera = np.array(key[0], dtype=np.float64)
+        self._aspect = self.width / self.height
+        self._tan_half_fov = math.tan(self.fov / 2)
+        self._half_w = self.width / 2
+        self._half_h = self.height / 2
+
+    def _cube_projector(self, center: List[float]) -> Callable[[float], Tuple[np.ndarray, np.ndarray]]:
+        """
+        Get a cube projection function specialized for one center and the current camera.
+        
+        The center's offset from the camera is computed once, so repeated
+        cubes around the same center (e.g. an animated size) only scale the
+        corner offsets and project them. Projectors are cached per camera
+        position, view plane and center.
+        
+        Args:
+            center: Center point of the cube [x, y, z]
+            
+        Returns:
+            Function mapping a cube size to its (8, 3) vertices and their (8, 2) projection
+        """
+        # The camera position and projection constants are folded into the projector
+        key = (self._projection_key, tuple(center))
+        projector = self._cube_projectors.get(key)
+        if projector is not None:
+            return projector
+        
+        center_arr = np.asarray(center, dtype=np.float64)
+        rel_center = center_arr - self._camera
+        origin = np.zeros(3)
+        aspect, tan_half_fov = self._aspect, self._tan_half_fov
+        half_w, half_h = self._half_w, self._half_h
+        
+        def projector(size: float) -> Tuple[np.ndarray, np.ndarray]:
+            offsets = _CUBE_OFFSETS * (size / 2)
+            projected = project_points(rel_center + offsets, origin, aspect, tan_half_fov, half_w, half_h)
+            return center_arr + offsets, projected
+        
+        if len(self._cube_projectors) >= _MAX_CUBE_PROJECTORS:
+            self._cube_projectors.clear()
+        self._cube_projectors[key] = projector
+        return projector
         
     def set_camera(self, position: List[float], target: List[float] = None, up: List[float] = None):
         """
@@ -99,6 +234,7 @@ class Grid3DRenderer:
         Returns:
             A list of SVG element dictionaries
         """
+        self._refresh_projection()
         # Set default attributes if not provided
         attrs = {
             "stroke": "#000000",
@@ -107,44 +243,20 @@ class Grid3DRenderer:
         }
         attrs.update(attributes)
         
-        # Define the cube vertices
-        half_size = size / 2
-        vertices = [
-            [center[0] - half_size, center[1] - half_size, center[2] - half_size],  # 0: front bottom left
-            [center[0] + half_size, center[1] - half_size, center[2] - half_size],  # 1: front bottom right
-            [center[0] + half_size, center[1] + half_size, center[2] - half_size],  # 2: front top right
-            [center[0] - half_size, center[1] + half_size, center[2] - half_size],  # 3: front top left
-            [center[0] - half_size, center[1] - half_size, center[2] + half_size],  # 4: back bottom left
-            [center[0] + half_size, center[1] - half_size, center[2] + half_size],  # 5: back bottom right
-            [center[0] + half_size, center[1] + half_size, center[2] + half_size],  # 6: back top right
-            [center[0] - half_size, center[1] + half_size, center[2] + half_size]   # 7: back top left
-        ]
-        
-        # Define the edges
-        edges = [
-            # Front face
-            (0, 1), (1, 2), (2, 3), (3, 0),
-            # Back face
-            (4, 5), (5, 6), (6, 7), (7, 4),
-            # Connecting edges
-            (0, 4), (1, 5), (2, 6), (3, 7)
-        ]
-        
-        # Project vertices
-        projected_vertices = [self._project_point(v) for v in vertices]
-        
-        # Create line elements
+        # Cube vertices as one contiguous (8, 3) array, projected once; edges
+        # index into the projection
+        vertices, projected = self._cube_projector(center)(size)
+        # Start and end points of every edge in one fancy-index, shape (12, 2, 2)
+        segments = projected[_CUBE_EDGES]
+        visible = np.flatnonzero(self._visible_mask(vertices[_CUBE_EDGES], segments)).tolist()
+        segments = segments.tolist()
+        
+        # Create line elements for the edges that may be on screen; ids keep the edge number
+        create_line_raw = ShapeFactory.create_line_raw
         elements = []
-        for i, edge in enumerate(edges):
-            start, end = edge
-            line = ShapeFactory.create_line(
-                projected_vertices[start][0],
-                projected_vertices[start][1],
-                projected_vertices[end][0],
-                projected_vertices[end][1],
-                **attrs,
-                id=f"cube_edge_{i}"
-            )
+        for i in visible:
+            (x1, y1), (x2, y2) = segments[i]
+            line = create_line_raw(x1, y1, x2, y2, attrs, f"cube_edge_{i}")
             elements.append(line)
             
         return elements
@@ -163,6 +275,7 @@ class Grid3DRenderer:
         Returns:
             A list of SVG element dictionaries
         """
+        self._refresh_projection()
         # Set default attributes if not provided
         attrs = {
             "stroke": "#888888",
@@ -174,54 +287,35 @@ class Grid3DRenderer:
         half_size = size / 2
         step = size / divisions
         
-        elements = []
-        line_count = 0
+        # One line per (z, offset) pair: z varies slowest, matching the line ids below
+        ticks = np.arange(divisions + 1) * step
+        zs, offsets = np.meshgrid(center[2] - half_size + ticks, ticks, indexing="ij")
+        zs, offsets = zs.ravel(), offsets.ravel()
+        xs = center[0] - half_size + offsets
+        ys = center[1] - half_size + offsets
+        low_x, high_x = np.full_like(zs, center[0] - half_size), np.full_like(zs, center[0] + half_size)
+        low_y, high_y = np.full_like(zs, center[1] - half_size), np.full_like(zs, center[1] + half_size)
         
-        # Create horizontal grid lines (along X-axis)
-        for i in range(divisions + 1):
-            z = center[2] - half_size + i * step
-            for j in range(divisions + 1):
-                y = center[1] - half_size + j * step
-                
-                # Create horizontal line along X
-                start = [center[0] - half_size, y, z]
-                end = [center[0] + half_size, y, z]
-                
-                # Project points and create line
-                start_2d = self._project_point(start)
-                end_2d = self._project_point(end)
-                
-                line = ShapeFactory.create_line(
-                    start_2d[0], start_2d[1],
-                    end_2d[0], end_2d[1],
-                    **attrs,
-                    id=f"grid_line_x_{line_count}"
-                )
-                elements.append(line)
-                line_count += 1
-                    
-        # Create vertical grid lines (along Y-axis)
-        for i in range(divisions + 1):
-            z = center[2] - half_size + i * step
-            for j in range(divisions + 1):
-                x = center[0] - half_size + j * step
-                
-                # Create vertical line along Y
-                start = [x, center[1] - half_size, z]
-                end = [x, center[1] + half_size, z]
-                
-                # Project points and create line
-                start_2d = self._project_point(start)
-                end_2d = self._project_point(end)
-                
-                line = ShapeFactory.create_line(
-                    start_2d[0], start_2d[1],
-                    end_2d[0], end_2d[1],
-                    **attrs,
-                    id=f"grid_line_y_{line_count}"
-                )
-                elements.append(line)
-                line_count += 1
+        # Line end points: lines along X first, then lines along Y
+        starts = np.concatenate((np.column_stack((low_x, ys, zs)), np.column_stack((xs, low_y, zs))))
+        ends = np.concatenate((np.column_stack((high_x, ys, zs)), np.column_stack((xs, high_y, zs))))
+        x_line_count = len(zs)
+        
+        # Project all end points at once
+        projected = self._project_points(np.concatenate((starts, ends)))
+        segments = np.stack((projected[:len(starts)], projected[len(starts):]), axis=1)
+        visible = self._visible_mask(np.stack((starts, ends), axis=1), segments)
+        segments = segments.tolist()
+        
+        # Create line elements for the lines that may be on screen; line ids
+        # keep counting across both directions, including culled lines
+        create_line_raw = ShapeFactory.create_line_raw
+        elements = []
+        for line_count in np.flatnonzero(visible).tolist():
+            (x1, y1), (x2, y2) = segments[line_count]
+            axis = "x" if line_count < x_line_count else "y"
+            line = create_line_raw(x1, y1, x2, y2, attrs, f"grid_line_{axis}_{line_count}")
+            elements.append(line)
                     
         return elements
         
@@ -239,6 +333,7 @@ class Grid3DRenderer:
         Returns:
             A list of SVG element dictionaries
         """
+        self._refresh_projection()
         # Set default attributes if not provided
         attrs = {
             "stroke": "#444444",
@@ -249,29 +344,28 @@ class Grid3DRenderer:
         
         elements = []
         
+        # Angle tables shared by every ring
+        angles = np.linspace(0, 2 * math.pi, segments, endpoint=False)
+        cos_a, sin_a = np.cos(angles), np.sin(angles)
+        
+        # Circle points for all rings at once, in the y = 0 plane
+        ring_radii = radius * np.arange(1, rings + 1) / rings
+        ring_points = np.zeros((rings, segments, 3))
+        ring_points[..., 0] = ring_radii[:, None] * cos_a
+        ring_points[..., 2] = ring_radii[:, None] * sin_a
+        
+        # Project every ring in one call, skipping rings that are entirely off screen
+        projected_rings = self._project_points(ring_points).reshape(rings, segments, 2)
+        visible_rings = np.flatnonzero(self._visible_mask(ring_points, projected_rings)).tolist()
+        
         # Create rings
-        for r in range(1, rings + 1):
-            current_radius = radius * r / rings
-            
-            # Create circle points
-            points = []
-            for s in range(segments):
-                angle = 2 * math.pi * s / segments
-                x = current_radius * math.cos(angle)
-                y = 0
-                z = current_radius * math.sin(angle)
-                
-                # Transform to camera space
-                points.append([x, y, z])
-                
-            # Project points
-            projected_points = [self._project_point(p) for p in points]
+        for index in visible_rings:
+            r = index + 1
+            projected_points = projected_rings[index].tolist()
             
-            # Create path for the ring
-            path_data = f"M {projected_points[0][0]},{projected_points[0][1]}"
-            for point in projected_points[1:]:
-                path_data += f" L {point[0]},{point[1]}"
-            path_data += " Z"  # Close the path
+            # Create path for the ring, closing it back to the first point
+            coords = [f"{_f(x)},{_f(y)}" for x, y in projected_points]
+            path_data = "M " + " L ".join(coords) + " Z"
             
             path = ShapeFactory.create_path(
                 path_data,
@@ -280,23 +374,25 @@ class Grid3DRenderer:
             )
             elements.append(path)
                 
-        # Create radial lines
-        for s in range(segments):
-            angle = 2 * math.pi * s / segments
-            
-            start = [0, 0, 0]
-            end = [radius * math.cos(angle), 0, radius * math.sin(angle)]
-            
-            # Project points
-            start_2d = self._project_point(start)
-            end_2d = self._project_point(end)
-            
-            line = ShapeFactory.create_line(
-                start_2d[0], start_2d[1],
-                end_2d[0], end_2d[1],
-                **attrs,
-                id=f"radial_line_{s}"
-            )
+        # Create radial lines from the origin to the outer radius, reusing the
+        # angle tables; the origin is projected once, in the same batch as the ends
+        ends = np.zeros((segments, 3))
+        ends[:, 0] = radius * cos_a
+        ends[:, 2] = radius * sin_a
+        projected = self._project_points(np.concatenate((np.zeros((1, 3)), ends)))
+        start_2d, projected = projected[0], projected[1:]
+        
+        # Skip lines that are entirely off screen; ids keep the segment number
+        lines = np.stack((np.zeros_like(ends), ends), axis=1)
+        lines_2d = np.stack((np.broadcast_to(start_2d, projected.shape), projected), axis=1)
+        visible = np.flatnonzero(self._visible_mask(lines, lines_2d)).tolist()
+        x1, y1 = start_2d.tolist()
+        ends_2d = projected.tolist()
+        
+        create_line_raw = ShapeFactory.create_line_raw
+        for s in visible:
+            x2, y2 = ends_2d[s]
+            line = create_line_raw(x1, y1, x2, y2, attrs, f"radial_line_{s}")
             elements.append(line)
                 
         return elements
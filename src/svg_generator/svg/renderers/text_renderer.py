@@ -2,16 +2,41 @@
 """
 Text renderer for SVG generation with advanced text layout features.
 """
+from functools import lru_cache
 from typing import List, Dict, Any, Tuple, Optional, Union
 import math
 import logging
 import re
 
+import numpy as np
+
 from svg_generator.utils.text_utils import TextUtils
 from svg_generator.svg.shapes import ShapeFactory
 
 logger = logging.getLogger(__name__)
 
+# Character classes (lower-cased) used by the text-to-path approximation
+_ALNUM = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_TALL = frozenset("bdfhijklt")    # Ascenders
+_DESC = frozenset("gpqy")         # Descenders
+_ROUND = frozenset("oq0")         # Drawn as circles
+_HBAR = frozenset("aefhtz")       # Get a horizontal stroke
+
+# Keyword arguments the effect renderers map to hyphenated SVG attributes
+# themselves; every other keyword is passed through unchanged
+_BASE_TEXT_KWARGS = frozenset({'font_size', 'text_anchor', 'dominant_baseline', 'font_family'})
+
+@lru_cache(maxsize=128)
+def _text_style(font_size: Union[float, str], font_family: str, text_anchor: str,
+                dominant_baseline: str) -> Dict[str, Any]:
+    """Shared font attributes for a text element; callers copy it ({**style, ...}) rather than mutate it."""
+    return {
+        'font-size': font_size,
+        'font-family': font_family,
+        'text-anchor': text_anchor,
+        'dominant-baseline': dominant_baseline
+    }
+
 class TextRenderer:
     """
     Renders text with advanced formatting and layout options.
@@ -65,13 +90,7 @@ class TextRenderer:
                                             fill, text_anchor, additional_attrs)
         
         # Standard text element
-        attrs = {
-            'font-size': str(font_size),
-            'font-family': font_family,
-            'fill': fill,
-            'text-anchor': text_anchor,
-            'dominant-baseline': dominant_baseline
-        }
+        attrs = {**_text_style(str(font_size), font_family, text_anchor, dominant_baseline), 'fill': fill}
         
         # Add additional attributes
         if additional_attrs:
@@ -116,87 +135,74 @@ class TextRenderer:
         elif text_anchor == 'end':
             x -= text_width
             
-        # Create a group for the text paths
-        paths = []
-        
         # Character metrics (very simplified)
         char_width = font_size * 0.6  # Approximation
+        rect_width = char_width * 0.8
+        base_height = font_size * 0.8
+        
+        # Classify every character at once. Spaces and other characters
+        # outside _ALNUM get no shape but still advance the position.
+        lowered = np.array([char.lower() for char in text], dtype=str)
+        tall = np.isin(lowered, list(_TALL))
+        descender = np.isin(lowered, list(_DESC))
+        
+        # Simplified glyph boxes for all characters: tall characters and
+        # characters with descenders are 20% taller and shifted up or down
+        char_xs = x + np.arange(len(text)) * char_width
+        rect_heights = np.where(tall | descender, base_height * 1.2, base_height)
+        rect_ys = y - base_height * 0.7  # Align with baseline
+        rect_ys = np.where(tall, rect_ys - rect_heights * 0.1,
+                           np.where(descender, rect_ys + rect_heights * 0.1, rect_ys))
+        
+        # Shape constructors used inside the loop below, looked up once
+        create_circle = ShapeFactory.create_circle
+        create_rectangle = ShapeFactory.create_rectangle
+        create_line_raw = ShapeFactory.create_line_raw
+        stroke_attrs = {'stroke': fill, 'stroke-width': font_size * 0.1}
+        
+        # Create a group for the text paths; only the element dictionaries
+        # are built per character. In a real implementation, these would use
+        # actual glyph outlines
+        paths = []
+        shaped = np.flatnonzero(np.isin(lowered, list(_ALNUM))).tolist()
+        round_chars = np.isin(lowered, list(_ROUND)).tolist()
+        hbar_chars = np.isin(lowered, list(_HBAR)).tolist()
+        char_xs, rect_ys, rect_heights = char_xs.tolist(), rect_ys.tolist(), rect_heights.tolist()
         
-        # Create simplified path for each character
-        for i, char in enumerate(text):
-            char_x = x + i * char_width
+        for i in shaped:
+            rect_x, rect_y, rect_height = char_xs[i], rect_ys[i], rect_heights[i]
             
-            # Skip spaces
-            if char == ' ':
+            if round_chars[i]:
+                # Round characters (approximate as circle)
+                paths.append(create_circle(
+                    rect_x + rect_width / 2,
+                    rect_y + rect_height / 2,
+                    min(rect_width, rect_height) / 2,
+                    fill=fill,
+                    id=f"text_path_{i}"
+                ))
                 continue
-                
-            # Create a simplified character path
-            # This is a very basic approximation
-            # Real implementations would use actual font outlines
-            if char.lower() in 'abcdefghijklmnopqrstuvwxyz0123456789':
-                # Create a small rectangle for each character
-                rect_width = char_width * 0.8
-                rect_height = font_size * 0.8
-                
-                # Position the rectangle
-                rect_x = char_x
-                rect_y = y - rect_height * 0.7  # Align with baseline
-                
-                # Add some variation based on character
-                if char.lower() in 'bdfhijklt':
-                    # Tall characters
-                    rect_height *= 1.2
-                    rect_y -= rect_height * 0.1
-                elif char.lower() in 'gpqy':
-                    # Characters with descenders
-                    rect_height *= 1.2
-                    rect_y += rect_height * 0.1
-                
-                # Create path for character
-                # In a real implementation, this would use actual glyph outlines
-                if char.lower() in 'oq0':
-                    # Round characters (approximate as circle)
-                    circle_radius = min(rect_width, rect_height) / 2
-                    
-                    path = ShapeFactory.create_circle(
-                        rect_x + rect_width / 2,
-                        rect_y + rect_height / 2,
-                        circle_radius,
-                        fill=fill,
-                        id=f"text_path_{i}"
-                    )
-                    
-                    paths.append(path)
-                else:
-                    # Other characters (approximate as rectangle)
-                    path = ShapeFactory.create_rect(
-                        rect_x,
-                        rect_y,
-                        rect_width,
-                        rect_height,
-                        rx=rect_width * 0.2,  # Rounded corners
-                        ry=rect_height * 0.2,
-                        fill=fill,
-                        id=f"text_path_{i}"
-                    )
-                    
-                    paths.append(path)
-                    
-                    # For characters with horizontal strokes, add a line
-                    if char.lower() in 'aefhtz':
-                        line_y = rect_y + rect_height * 0.4
-                        
-                        line = ShapeFactory.create_line(
-                            rect_x,
-                            line_y,
-                            rect_x + rect_width,
-                            line_y,
-                            stroke=fill,
-                            stroke_width=font_size * 0.1,
-                            id=f"text_path_{i}_stroke"
-                        )
-                        
-                        paths.append(line)
+            
+            # Other characters (approximate as rectangle)
+            paths.append(create_rectangle(
+                rect_x,
+                rect_y,
+                rect_width,
+                rect_height,
+                rx=rect_width * 0.2,  # Rounded corners
+                ry=rect_height * 0.2,
+                fill=fill,
+                id=f"text_path_{i}"
+            ))
+            
+            # For characters with horizontal strokes, add a line
+            if hbar_chars[i]:
+                line_y = rect_y + rect_height * 0.4
+                paths.append(create_line_raw(
+                    rect_x, line_y, rect_x + rect_width, line_y,
+                    stroke_attrs,
+                    f"text_path_{i}_stroke"
+                ))
         
         # Add additional attributes to each path if provided
         if additional_attrs:
@@ -273,32 +279,29 @@ class TextRenderer:
         # Sanitize text
         text = TextUtils.sanitize_text_for_svg(text)
         
+        # Character positions along the circle, all at once; spaces are
+        # skipped but still take up their share of the arc
+        indices = [i for i, char in enumerate(text) if char != ' ']
+        angle_dir = -1 if clockwise else 1
+        angles = start_angle + np.array(indices) * char_angle * angle_dir
+        angles_rad = np.radians(angles)
+        xs = (center_x + radius * np.cos(angles_rad)).tolist()
+        ys = (center_y + radius * np.sin(angles_rad)).tolist()
+        # Rotation for proper orientation along the curve
+        rotations = (angles + (90 if clockwise else -90)).tolist()
+        
         # Create elements for each character
+        create_text_element = TextUtils.create_text_element
         elements = []
         
-        for i, char in enumerate(text):
-            # Skip spaces in curved text
-            if char == ' ':
-                continue
-                
-            # Calculate angle for this character
-            angle_dir = -1 if clockwise else 1
-            angle = start_angle + (i * char_angle * angle_dir)
-            
-            # Calculate position
-            x = center_x + radius * math.cos(math.radians(angle))
-            y = center_y + radius * math.sin(math.radians(angle))
-            
+        for i, x, y, rotation in zip(indices, xs, ys, rotations):
             # Create text element
-            char_element = TextUtils.create_text_element(
-                text=char,
+            char_element = create_text_element(
+                text=text[i],
                 x=x,
                 y=y,
                 **text_attrs
             )
-            
-            # Add rotation for proper orientation along the curve
-            rotation = angle + (90 if clockwise else -90)
             char_element['transform'] = f"rotate({rotation}, {x}, {y})"
             
             elements.append(char_element)
@@ -325,26 +328,20 @@ class TextRenderer:
         Returns:
             List containing background and foreground text elements
         """
-        # Create base text attributes
+        # Create base text attributes, adding any other attributes
         base_attrs = {
-            'font-size': font_size,
-            'text-anchor': text_attrs.get('text_anchor', 'start'),
-            'dominant-baseline': text_attrs.get('dominant_baseline', 'auto'),
-            'font-family': text_attrs.get('font_family', 'Arial')
+            **_text_style(font_size, text_attrs.get('font_family', 'Arial'),
+                          text_attrs.get('text_anchor', 'start'), text_attrs.get('dominant_baseline', 'auto')),
+            **{key: value for key, value in text_attrs.items() if key not in _BASE_TEXT_KWARGS}
         }
-        
-        # Add any other attributes
-        for key, value in text_attrs.items():
-            if key not in ['font_size', 'text_anchor', 'dominant_baseline', 'font_family']:
-                base_attrs[key] = value
                 
         # Create background (outline) element
-        outline_attrs = base_attrs.copy()
-        outline_attrs.update({
+        outline_attrs = {
+            **base_attrs,
             'stroke': stroke,
             'stroke-width': stroke_width,
             'fill': 'none'
-        })
+        }
         
         outline_element = TextUtils.create_text_element(
             text=text,
@@ -354,11 +351,11 @@ class TextRenderer:
         )
         
         # Create foreground (fill) element
-        fill_attrs = base_attrs.copy()
-        fill_attrs.update({
+        fill_attrs = {
+            **base_attrs,
             'fill': fill,
             'stroke': 'none'
-        })
+        }
         
         fill_element = TextUtils.create_text_element(
             text=text,
@@ -391,25 +388,19 @@ class TextRenderer:
         Returns:
             List containing shadow and foreground text elements
         """
-        # Create base text attributes
+        # Create base text attributes, adding any other attributes
         base_attrs = {
-            'font-size': font_size,
-            'text-anchor': text_attrs.get('text_anchor', 'start'),
-            'dominant-baseline': text_attrs.get('dominant_baseline', 'auto'),
-            'font-family': text_attrs.get('font_family', 'Arial')
+            **_text_style(font_size, text_attrs.get('font_family', 'Arial'),
+                          text_attrs.get('text_anchor', 'start'), text_attrs.get('dominant_baseline', 'auto')),
+            **{key: value for key, value in text_attrs.items() if key not in _BASE_TEXT_KWARGS}
         }
-        
-        # Add any other attributes
-        for key, value in text_attrs.items():
-            if key not in ['font_size', 'text_anchor', 'dominant_baseline', 'font_family']:
-                base_attrs[key] = value
                 
         # Create shadow element
-        shadow_attrs = base_attrs.copy()
-        shadow_attrs.update({
+        shadow_attrs = {
+            **base_attrs,
             'fill': shadow_color,
             'filter': 'url(#shadow-filter)'  # This requires a filter definition
-        })
+        }
         
         shadow_element = TextUtils.create_text_element(
             text=text,
@@ -419,10 +410,7 @@ class TextRenderer:
         )
         
         # Create main text element
-        text_attrs = base_attrs.copy()
-        text_attrs.update({
-            'fill': fill
-        })
+        text_attrs = {**base_attrs, 'fill': fill}
         
         text_element = TextUtils.create_text_element(
             text=text,
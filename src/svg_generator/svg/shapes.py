@@ -3,13 +3,33 @@
 Element factory for building SVG shapes with customization options.
 This module adapts and extends the original ElementFactory functionality.
 """
-from typing import Dict, Any, List, Tuple, Optional
+from typing import Dict, Any, List, Tuple, Optional, Union
 import xml.etree.ElementTree as ET
+from functools import lru_cache
 import math
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+@lru_cache(maxsize=256)
+def _unit_vertices(count: int, rotation_rad: float) -> np.ndarray:
+    """
+    Returns `count` evenly spaced points on the unit circle, starting at `rotation_rad`.
+
+    Uses the angle-addition recurrence (a cumulative product of the unit
+    complex step), so only two cos/sin pairs are evaluated per table. The
+    result is cached and read-only.
+    """
+    step = 2 * math.pi / count
+    z = np.full(count, complex(math.cos(step), math.sin(step)))
+    z[0] = complex(math.cos(rotation_rad), math.sin(rotation_rad))
+    z = np.cumprod(z)
+    unit = np.column_stack((z.real, z.imag))
+    unit.flags.writeable = False
+    return unit
+
 class ShapeFactory:
     """
     Factory for creating SVG shape elements with optimized attributes.
@@ -30,9 +50,7 @@ class ShapeFactory:
         Returns:
             Dictionary representation of the SVG element
         """
-        element_dict = {"type": element_type}
-        element_dict.update(attributes)
-        return element_dict
+        return {"type": element_type, **attributes}
         
     @staticmethod
     def create_circle(cx: float, cy: float, radius: float, **attributes) -> Dict[str, Any]:
@@ -48,8 +66,7 @@ class ShapeFactory:
         Returns:
             Dictionary representation of the circle element
         """
-        attributes.update({"cx": cx, "cy": cy, "r": radius})
-        return ShapeFactory.create_element_dict("circle", **attributes)
+        return {"type": "circle", **attributes, "cx": cx, "cy": cy, "r": radius}
         
     @staticmethod
     def create_rectangle(x: float, y: float, width: float, height: float, **attributes) -> Dict[str, Any]:
@@ -66,8 +83,7 @@ class ShapeFactory:
         Returns:
             Dictionary representation of the rectangle element
         """
-        attributes.update({"x": x, "y": y, "width": width, "height": height})
-        return ShapeFactory.create_element_dict("rect", **attributes)
+        return {"type": "rect", **attributes, "x": x, "y": y, "width": width, "height": height}
         
     @staticmethod
     def create_rounded_rectangle(x: float, y: float, width: float, height: float, 
@@ -89,8 +105,8 @@ class ShapeFactory:
         """
         if ry is None:
             ry = rx
-        attributes.update({"x": x, "y": y, "width": width, "height": height, "rx": rx, "ry": ry})
-        return ShapeFactory.create_element_dict("rect", **attributes)
+        return {"type": "rect", **attributes, "x": x, "y": y, "width": width, "height": height,
+                "rx": rx, "ry": ry}
         
     @staticmethod
     def create_line(x1: float, y1: float, x2: float, y2: float, **attributes) -> Dict[str, Any]:
@@ -107,38 +123,63 @@ class ShapeFactory:
         Returns:
             Dictionary representation of the line element
         """
-        attributes.update({"x1": x1, "y1": y1, "x2": x2, "y2": y2})
-        return ShapeFactory.create_element_dict("line", **attributes)
-        
+        return {"type": "line", **attributes, "x1": x1, "y1": y1, "x2": x2, "y2": y2}
+
+    @staticmethod
+    def create_line_raw(x1: float, y1: float, x2: float, y2: float,
+                        attributes: Dict[str, Any], id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create a line element dictionary from a prebuilt attribute dictionary.
+
+        Equivalent to create_line(x1, y1, x2, y2, **attributes, id=id), but the
+        attributes are copied straight from the given dictionary, which is left
+        unchanged; meant for renderers that emit many lines with the same style.
+
+        Args:
+            x1: x-coordinate of the start point
+            y1: y-coordinate of the start point
+            x2: x-coordinate of the end point
+            y2: y-coordinate of the end point
+            attributes: Attributes shared by the lines (stroke, fill, ...)
+            id: Optional element id
+
+        Returns:
+            Dictionary representation of the line element
+        """
+        line = {"type": "line", **attributes, "x1": x1, "y1": y1, "x2": x2, "y2": y2}
+        if id is not None:
+            line["id"] = id
+        return line
+
     @staticmethod
-    def create_polyline(points: List[Tuple[float, float]], **attributes) -> Dict[str, Any]:
+    def create_polyline(points: Union[List[Tuple[float, float]], np.ndarray], **attributes) -> Dict[str, Any]:
         """
         Create a polyline SVG element dictionary.
         
         Args:
-            points: List of (x, y) coordinate tuples
+            points: List of (x, y) coordinate tuples, or an (N, 2) NumPy array
+                (stored as-is; the generator formats it directly)
             **attributes: Additional attributes for the polyline
             
         Returns:
             Dictionary representation of the polyline element
         """
-        attributes.update({"points": points})
-        return ShapeFactory.create_element_dict("polyline", **attributes)
+        return {"type": "polyline", **attributes, "points": points}
         
     @staticmethod
-    def create_polygon(points: List[Tuple[float, float]], **attributes) -> Dict[str, Any]:
+    def create_polygon(points: Union[List[Tuple[float, float]], np.ndarray], **attributes) -> Dict[str, Any]:
         """
         Create a polygon SVG element dictionary.
         
         Args:
-            points: List of (x, y) coordinate tuples
+            points: List of (x, y) coordinate tuples, or an (N, 2) NumPy array
+                (stored as-is; the generator formats it directly)
             **attributes: Additional attributes for the polygon
             
         Returns:
             Dictionary representation of the polygon element
         """
-        attributes.update({"points": points})
-        return ShapeFactory.create_element_dict("polygon", **attributes)
+        return {"type": "polygon", **attributes, "points": points}
         
     @staticmethod
     def create_path(d: str, **attributes) -> Dict[str, Any]:
@@ -152,9 +193,35 @@ class ShapeFactory:
         Returns:
             Dictionary representation of the path element
         """
-        attributes.update({"d": d})
-        return ShapeFactory.create_element_dict("path", **attributes)
-        
+        return {"type": "path", **attributes, "d": d}
+
+    @staticmethod
+    def create_path_fast(d: str, *, stroke: str = "#000", width: float = 1, fill: str = "none",
+                         opacity: float = 1.0, id: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Create a stroked path element dictionary with a fixed set of attributes.
+
+        Equivalent to create_path with the same attributes, but builds the
+        dictionary directly instead of merging keyword arguments; meant for
+        renderers that emit thousands of paths (e.g. chords).
+
+        Args:
+            d: Path data string
+            stroke: Stroke color
+            width: Stroke width
+            fill: Fill color
+            opacity: Element opacity
+            id: Optional element id
+
+        Returns:
+            Dictionary representation of the path element
+        """
+        path = {"type": "path", "d": d, "stroke": stroke, "stroke-width": width,
+                "fill": fill, "opacity": opacity}
+        if id is not None:
+            path["id"] = id
+        return path
+
     @staticmethod
     def create_regular_polygon(cx: float, cy: float, radius: float, sides: int, 
                               rotation: float = 0, **attributes) -> Dict[str, Any]:
@@ -179,13 +246,9 @@ class ShapeFactory:
         # Convert rotation to radians
         rotation_rad = math.radians(rotation)
         
-        # Generate points
-        points = []
-        for i in range(sides):
-            angle = rotation_rad + (2 * math.pi * i / sides)
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            points.append((x, y))
+        # Scale the cached unit vertices, then hand out the usual list of (x, y) tuples
+        points = _unit_vertices(sides, rotation_rad) * radius + (cx, cy)
+        points = list(map(tuple, points.tolist()))
             
         return ShapeFactory.create_polygon(points, **attributes)
         
@@ -214,14 +277,10 @@ class ShapeFactory:
         # Convert rotation to radians
         rotation_rad = math.radians(rotation)
         
-        # Generate star points
-        star_points = []
-        for i in range(points * 2):
-            angle = rotation_rad + (2 * math.pi * i / (points * 2))
-            radius = outer_radius if i % 2 == 0 else inner_radius
-            x = cx + radius * math.cos(angle)
-            y = cy + radius * math.sin(angle)
-            star_points.append((x, y))
+        # Generate star points, alternating outer (even) and inner (odd) vertices
+        radii = np.where(np.arange(points * 2) & 1, inner_radius, outer_radius)
+        star_points = _unit_vertices(points * 2, rotation_rad) * radii[:, None] + (cx, cy)
+        star_points = list(map(tuple, star_points.tolist()))
             
         return ShapeFactory.create_polygon(star_points, **attributes)
         
@@ -240,5 +299,4 @@ class ShapeFactory:
         Returns:
             Dictionary representation of the ellipse element
         """
-        attributes.update({"cx": cx, "cy": cy, "rx": rx, "ry": ry})
-        return ShapeFactory.create_element_dict("ellipse", **attributes)
+        return {"type": "ellipse", **attributes, "cx": cx, "cy": cy, "rx": rx, "ry": ry}
@@ -2,15 +2,57 @@
 """
 Color utilities for SVG generation.
 """
+from functools import lru_cache
 import random
-import colorsys
 import re
 import math
 import logging
 from typing import Tuple, List, Dict, Union, Optional
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Patterns used by ColorUtils.parse_color (input is lower-cased first)
+_RGB_RE = re.compile(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)')
+_HEX_RE = re.compile(r'#([0-9a-f]{3}|[0-9a-f]{6})')
+
+def _hue_to_channel(m1: float, m2: float, hue: float) -> float:
+    """Channel value (0-1) of an HSL color at the given hue offset; same math as colorsys."""
+    hue = hue % 1.0
+    if hue < 1.0 / 6.0:
+        return m1 + (m2 - m1) * hue * 6.0
+    if hue < 0.5:
+        return m2
+    if hue < 2.0 / 3.0:
+        return m1 + (m2 - m1) * (2.0 / 3.0 - hue) * 6.0
+    return m1
+
+def _hsl_batch_to_hex(h: Union[float, np.ndarray], s: float,
+                      l: Union[float, np.ndarray]) -> List[str]:
+    """
+    Converts a batch of HSL colors to hex strings in one vectorized pass.
+
+    Same arithmetic as ColorUtils.hsl_to_rgb followed by rgb_to_hex, applied
+    element-wise; h and l broadcast against each other (H: 0-360, S/L: 0-100).
+    """
+    h, l = np.broadcast_arrays(np.asarray(h, dtype=np.float64) / 360, np.asarray(l, dtype=np.float64) / 100)
+    s = s / 100
+    if s == 0.0:
+        rgb = np.repeat(l[:, None], 3, axis=1)
+    else:
+        m2 = np.where(l <= 0.5, l * (1.0 + s), l + s - (l * s))[:, None]
+        m1 = 2.0 * l[:, None] - m2
+        hues = np.stack((h + 1.0 / 3.0, h, h - 1.0 / 3.0), axis=1) % 1.0
+        rgb = np.select(
+            [hues < 1.0 / 6.0, hues < 0.5, hues < 2.0 / 3.0],
+            [m1 + (m2 - m1) * hues * 6.0, m2, m1 + (m2 - m1) * (2.0 / 3.0 - hues) * 6.0],
+            m1,
+        )
+    # Truncate like int(), clamp like hsl_to_rgb, then hex-encode every channel at once
+    digits = np.clip((rgb * 255).astype(np.int64), 0, 255).astype(np.uint8).tobytes().hex()
+    return ['#' + digits[i:i + 6] for i in range(0, len(digits), 6)]
+
 class ColorUtils:
     """
     Color manipulation utilities for SVG generation.
@@ -69,11 +111,18 @@ class ColorUtils:
         "violet": "#ee82ee", "wheat": "#f5deb3", "white": "#ffffff",
         "whitesmoke": "#f5f5f5", "yellow": "#ffff00", "yellowgreen": "#9acd32"
     }
+
+    # WEB_COLORS decoded once, so named colors skip hex parsing
+    _WEB_COLORS_RGB = {name: tuple(bytes.fromhex(value[1:])) for name, value in WEB_COLORS.items()}
     
     @classmethod
+    @lru_cache(maxsize=1024)
     def parse_color(cls, color: str) -> Tuple[int, int, int]:
         """
         Parse color string to RGB tuple.
+
+        Results are cached per color string, so an unparseable color is
+        only warned about once.
         
         Args:
             color: Color string (hex, rgb, or name)
@@ -84,21 +133,23 @@ class ColorUtils:
         color = color.lower().strip()
         
         # Check if it's a named color
-        if color in cls.WEB_COLORS:
-            color = cls.WEB_COLORS[color]
+        rgb = cls._WEB_COLORS_RGB.get(color)
+        if rgb is not None:
+            return rgb
         
-        # Check if it's a hex color
-        if color.startswith('#'):
-            color = color.lstrip('#')
+        # Check if it's a hex color; malformed hex falls through to the warning
+        hex_match = _HEX_RE.fullmatch(color)
+        if hex_match:
+            color = hex_match.group(1)
             
             # Convert shorthand (3 chars) to full form (6 chars)
             if len(color) == 3:
                 color = ''.join([c + c for c in color])
                 
-            return tuple(int(color[i:i+2], 16) for i in (0, 2, 4))
+            return tuple(bytes.fromhex(color))
             
         # Check if it's an RGB color
-        rgb_match = re.match(r'rgb\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)', color)
+        rgb_match = _RGB_RE.match(color)
         if rgb_match:
             return tuple(map(int, rgb_match.groups()))
             
@@ -112,12 +163,13 @@ class ColorUtils:
         Convert RGB tuple to hex color string.
         
         Args:
-            rgb: RGB tuple (0-255 for each component)
+            rgb: RGB tuple (integers; components are clamped to 0-255)
             
         Returns:
             Hex color string (#RRGGBB)
         """
-        return '#{:02x}{:02x}{:02x}'.format(*rgb)
+        r, g, b = rgb
+        return '#' + bytes((min(255, max(0, r)), min(255, max(0, g)), min(255, max(0, b)))).hex()
     
     @staticmethod
     def hex_to_rgb(hex_color: str) -> Tuple[int, int, int]:
@@ -136,22 +188,38 @@ class ColorUtils:
         if len(hex_color) == 3:
             hex_color = ''.join([c + c for c in hex_color])
             
-        return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
+        return tuple(bytes.fromhex(hex_color))
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def rgb_to_hsl(rgb: Tuple[int, int, int]) -> Tuple[float, float, float]:
         """
         Convert RGB to HSL.
         
         Args:
-            rgb: RGB tuple (0-255 for each component)
+            rgb: RGB tuple (0-255 for each component); must be hashable
             
         Returns:
             HSL tuple (H: 0-360, S: 0-100, L: 0-100)
         """
-        r, g, b = [x / 255.0 for x in rgb]
-        h, l, s = colorsys.rgb_to_hls(r, g, b)
-        return (h * 360, s * 100, l * 100)
+        # Same arithmetic as colorsys.rgb_to_hls, without the extra calls
+        r, g, b = rgb
+        r, g, b = r / 255.0, g / 255.0, b / 255.0
+        maxc = max(r, g, b)
+        minc = min(r, g, b)
+        sumc = maxc + minc
+        l = sumc / 2.0
+        if minc == maxc:
+            return (0.0, 0.0, l * 100)
+        rangec = maxc - minc
+        s = rangec / sumc if l <= 0.5 else rangec / (2.0 - maxc - minc)
+        if r == maxc:
+            h = (maxc - b) / rangec - (maxc - g) / rangec
+        elif g == maxc:
+            h = 2.0 + (maxc - r) / rangec - (maxc - b) / rangec
+        else:
+            h = 4.0 + (maxc - g) / rangec - (maxc - r) / rangec
+        return (((h / 6.0) % 1.0) * 360, s * 100, l * 100)
     
     @staticmethod
     def hsl_to_rgb(hsl: Tuple[float, float, float]) -> Tuple[int, int, int]:
@@ -168,8 +236,16 @@ class ColorUtils:
         h /= 360
         s /= 100
         l /= 100
-        r, g, b = colorsys.hls_to_rgb(h, l, s)
-        return (int(r * 255), int(g * 255), int(b * 255))
+        # Same arithmetic as colorsys.hls_to_rgb; channels are clamped so
+        # out-of-range HSL input still yields a valid RGB tuple
+        if s == 0.0:
+            channel = min(255, max(0, int(l * 255)))
+            return (channel, channel, channel)
+        m2 = l * (1.0 + s) if l <= 0.5 else l + s - (l * s)
+        m1 = 2.0 * l - m2
+        return (min(255, max(0, int(_hue_to_channel(m1, m2, h + 1.0 / 3.0) * 255))),
+                min(255, max(0, int(_hue_to_channel(m1, m2, h) * 255))),
+                min(255, max(0, int(_hue_to_channel(m1, m2, h - 1.0 / 3.0) * 255))))
     
     @classmethod
     def darken(cls, color: str, amount: float = 0.2) -> str:
@@ -246,49 +322,34 @@ class ColorUtils:
         hsl = cls.rgb_to_hsl(rgb)
         h, s, l = hsl
         
-        palette = []
+        if count < 1:
+            return []
+        
+        # Hues (or lightnesses) for the whole palette are converted in one batch
+        steps = np.arange(count)
         
         if scheme == 'analogous':
             # Analogous colors are next to each other on the color wheel
-            for i in range(count):
-                angle = 360 / count
-                new_h = (h + i * angle) % 360
-                new_rgb = cls.hsl_to_rgb((new_h, s, l))
-                palette.append(cls.rgb_to_hex(new_rgb))
+            palette = _hsl_batch_to_hex((h + steps * (360 / count)) % 360, s, l)
                 
         elif scheme == 'complementary':
-            # Complementary colors are opposite on the color wheel
-            palette.append(cls.rgb_to_hex(rgb))
-            
-            for i in range(1, count):
-                # Generate shades between base and complement
-                ratio = i / (count - 1)
-                new_h = (h + ratio * 180) % 360
-                new_rgb = cls.hsl_to_rgb((new_h, s, l))
-                palette.append(cls.rgb_to_hex(new_rgb))
+            # Complementary colors are opposite on the color wheel;
+            # shades run between base and complement
+            ratios = steps[1:] / (count - 1)
+            palette = [cls.rgb_to_hex(rgb)] + _hsl_batch_to_hex((h + ratios * 180) % 360, s, l)
                 
         elif scheme == 'triadic':
             # Triadic colors are evenly spaced on the color wheel
-            for i in range(count):
-                new_h = (h + i * 120) % 360
-                new_rgb = cls.hsl_to_rgb((new_h, s, l))
-                palette.append(cls.rgb_to_hex(new_rgb))
+            palette = _hsl_batch_to_hex((h + steps * 120) % 360, s, l)
                 
         elif scheme == 'monochromatic':
             # Monochromatic colors vary in lightness or saturation
-            for i in range(count):
-                # Vary lightness
-                new_l = max(0, min(100, l - 40 + (i * 80 / (count - 1 or 1))))
-                new_rgb = cls.hsl_to_rgb((h, s, new_l))
-                palette.append(cls.rgb_to_hex(new_rgb))
+            new_l = np.clip(l - 40 + (steps * 80 / (count - 1 or 1)), 0, 100)
+            palette = _hsl_batch_to_hex(h, s, new_l)
                 
         else:
             # Default to a simple color list if scheme not recognized
-            palette.append(cls.rgb_to_hex(rgb))
-            for i in range(1, count):
-                new_h = (h + i * 360 / count) % 360
-                new_rgb = cls.hsl_to_rgb((new_h, s, l))
-                palette.append(cls.rgb_to_hex(new_rgb))
+            palette = [cls.rgb_to_hex(rgb)] + _hsl_batch_to_hex((h + steps[1:] * 360 / count) % 360, s, l)
         
         return palette[:count]  # Ensure we return exactly 'count' colors
     
@@ -379,10 +440,11 @@ class ColorUtils:
         rgb = cls.parse_color(color)
         
         # Calculate perceived brightness
-        # Using the formula: (0.299*R + 0.587*G + 0.114*B) / 255
-        brightness = (0.299 * rgb[0] + 0.587 * rgb[1] + 0.114 * rgb[2]) / 255
+        # Using the formula: (0.299*R + 0.587*G + 0.114*B) / 255, in integer
+        # thousandths with the division folded into the threshold
+        brightness = 299 * rgb[0] + 587 * rgb[1] + 114 * rgb[2]
         
-        return brightness < threshold
+        return brightness < threshold * 255000
     
     @classmethod
     def get_contrast_color(cls, color: str) -> str:
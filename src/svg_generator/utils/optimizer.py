@@ -164,20 +164,20 @@ class Optimizer:
         
         return result
     
-    def optimize_svg_string(self, svg_string: str) -> str:
+    def _optimize(self, svg_string: str) -> Tuple[str, bytes]:
         """
-        Optimizes an SVG string to reduce file size while preserving visual quality.
+        Runs the optimization passes and returns the result as both text and UTF-8 bytes.
         
         Args:
             svg_string: The SVG string to optimize
             
         Returns:
-            The optimized SVG string
+            Tuple of (optimized SVG string, the same string encoded as UTF-8)
         """
         logger.info("Starting SVG optimization process...")
         if not svg_string:
             logger.warning("Empty SVG string provided for optimization.")
-            return ""
+            return "", b""
         
         # Apply initial optimization
         if SCOUR_AVAILABLE:
@@ -186,7 +186,8 @@ class Optimizer:
             current_svg = self._apply_fallback_optimization(svg_string)
         
         # Check size against limit
-        current_size_bytes = len(current_svg.encode('utf-8'))
+        current_bytes = current_svg.encode('utf-8')
+        current_size_bytes = len(current_bytes)
         logger.debug(f"Size after initial optimization: {current_size_bytes} bytes.")
         
         # If still too large, try aggressive optimization
@@ -197,7 +198,8 @@ class Optimizer:
                 "Attempting aggressive optimization."
             )
             current_svg = self._apply_aggressive_optimization(current_svg)
-            current_size_bytes = len(current_svg.encode('utf-8'))
+            current_bytes = current_svg.encode('utf-8')
+            current_size_bytes = len(current_bytes)
             logger.info(f"Size after aggressive optimization: {current_size_bytes} bytes.")
             
             if current_size_bytes > MAX_SVG_SIZE_BYTES:
@@ -209,4 +211,31 @@ class Optimizer:
                 # Depending on policy, either raise an error or return the oversized SVG with a warning
                 
         logger.info(f"Optimization complete. Final SVG size: {current_size_bytes} bytes.")
-        return current_svg
+        return current_svg, current_bytes
+    
+    def optimize_svg_string(self, svg_string: str) -> str:
+        """
+        Optimizes an SVG string to reduce file size while preserving visual quality.
+        
+        Args:
+            svg_string: The SVG string to optimize
+            
+        Returns:
+            The optimized SVG string
+        """
+        return self._optimize(svg_string)[0]
+    
+    def optimize_svg_bytes(self, svg_string: str) -> bytes:
+        """
+        Optimizes an SVG string and returns the result encoded as UTF-8.
+        
+        The encoded form is what the size check measures, so callers that write
+        the result to disk can use it directly instead of encoding it again.
+        
+        Args:
+            svg_string: The SVG string to optimize
+            
+        Returns:
+            The optimized SVG as UTF-8 bytes
+        """
+        return self._optimize(svg_string)[1]
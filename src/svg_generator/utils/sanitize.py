@@ -5,20 +5,23 @@ Utilities for ensuring SVG compliance with competition requirements.
 import xml.etree.ElementTree as ET
 import re
 import logging
-from typing import Set, Optional, Tuple
+from typing import AbstractSet, Optional, Tuple
 
 from svg_generator.config import ALLOWED_SVG_TAGS, PROHIBITED_SVG_ATTRIBUTES
 
 logger = logging.getLogger(__name__)
 
+# Returned in place of a document whose root <svg> element was disallowed
+ROOT_REMOVED_FALLBACK_SVG = '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100"><text>Error: Root SVG removed</text></svg>'
+
 class Sanitizer:
     """
     Sanitizes SVG strings to ensure compliance with specified rules
     (e.g., allowed tags, prohibited attributes).
     """
     def __init__(self,
-                 allowed_tags: Optional[Set[str]] = None,
-                 prohibited_attributes: Optional[Set[str]] = None):
+                 allowed_tags: Optional[AbstractSet[str]] = None,
+                 prohibited_attributes: Optional[AbstractSet[str]] = None):
         self.allowed_tags = allowed_tags if allowed_tags is not None else ALLOWED_SVG_TAGS
         # 'id' needs special handling for defs. We'll disallow it generally,
         # but the optimizer (Scour) might manage IDs. Or allow 'id' and Scour handles unused ones.
@@ -38,6 +41,8 @@ class Sanitizer:
         Removes disallowed tags and attributes.
         """
         original_tag = element.tag
+        if not isinstance(original_tag, str): # Comment, processing instruction or entity node (lxml)
+            return None
         tag_name = self._strip_namespace_from_tag(original_tag)
 
         if tag_name not in self.allowed_tags:
@@ -83,6 +88,20 @@ class Sanitizer:
             
         return element
 
+    def sanitize_tree(self, root: ET.Element) -> Optional[ET.Element]:
+        """
+        Sanitizes an already parsed SVG tree in place.
+
+        Works on both ElementTree and lxml elements.
+
+        Args:
+            root: The root <svg> element.
+
+        Returns:
+            The sanitized root, or None if the root itself is disallowed.
+        """
+        return self._sanitize_element(root)
+
     def sanitize_svg_string(self, svg_string: str) -> str:
         """
         Parses an SVG string, sanitizes it, and returns the sanitized SVG string.
@@ -118,7 +137,7 @@ class Sanitizer:
 
             if sanitized_root is None:
                 logger.error("Root SVG element was disallowed during sanitization. Returning empty SVG.")
-                return '<svg xmlns="http://www.w3.org/2000/svg" width="100" height="100"><text>Error: Root SVG removed</text></svg>' # Fallback error SVG
+                return ROOT_REMOVED_FALLBACK_SVG
 
             # Reconstruct the string. ET.tostring typically uses 'us-ascii' by default for bytes.
             # For string output good to specify 'unicode'.
@@ -4,6 +4,7 @@ Text utilities for SVG generation and manipulation.
 """
 import re
 import textwrap
+from functools import lru_cache
 import hashlib
 import logging
 from typing import List, Dict, Any, Tuple, Optional
@@ -69,10 +70,13 @@ class TextUtils:
         return text[:max_length - len(ellipsis)] + ellipsis
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def generate_text_hash(text: str, length: int = 8) -> str:
         """
         Generate a hash from text, useful for IDs.
         
+        Results are cached, so repeated texts are hashed once.
+        
         Args:
             text: Text to hash
             length: Desired length of hash
@@ -84,10 +88,14 @@ class TextUtils:
         return hash_obj.hexdigest()[:length]
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def sanitize_text_for_svg(text: str) -> str:
         """
         Sanitize text for use in SVG.
         
+        Results are cached, so labels that are rendered repeatedly are
+        escaped once.
+        
         Args:
             text: Text to sanitize
             
@@ -104,12 +112,15 @@ class TextUtils:
         return sanitized
     
     @staticmethod
+    @lru_cache(maxsize=1024)
     def estimate_text_dimensions(text: str, font_size: float = 12.0,
                                font_family: str = 'Arial') -> Tuple[float, float]:
         """
         Estimate text dimensions based on character count and font size.
         
-        This is a simplified estimate and not an actual measurement.
+        This is a simplified estimate and not an actual measurement. Results
+        are cached per (text, font_size, font_family), so labels that are
+        rendered repeatedly are measured once.
         
         Args:
             text: Text to measure